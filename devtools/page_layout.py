@@ -1,41 +1,56 @@
+import copy
 import pymupdf as pypdf
 from lxml import etree
-import copy
+from functools import lru_cache
+from freeports_analysis.main import xml_parser
+
+
+# the same report is inspected page after page, opening it each time
+# would parse its xref table again on every call
+@lru_cache(maxsize=8)
+def _open_document(file_name: str) -> pypdf.Document:
+    return pypdf.Document(file_name)
+
+
+@lru_cache(maxsize=32)
+def _page_xml(file_name: str, i_page: int) -> bytes:
+    return _open_document(file_name)[i_page].get_text("xml").encode()
 
 
 def get_page(file_name: str, page: int, offset: int = 0):
-    pdf_file = pypdf.Document(file_name)
-    parser = etree.XMLParser(recover=True)
-    page_doc = pdf_file[page + offset]
-    xml_str = page_doc.get_text("xml")
-    xml_tree = etree.fromstring(xml_str.encode(), parser=parser)
+    # a new tree each time, so callers can modify it freely
+    xml_tree = etree.fromstring(_page_xml(file_name, page + offset), parser=xml_parser)
     return xml_tree
 
 
 def get_page_html(file_name: str, page: int, offset: int = 0):
-    pdf_file = pypdf.Document(file_name)
+    pdf_file = _open_document(file_name)
     page_doc = pdf_file[page + offset]
     html_str = page_doc.get_text("html")
     return html_str
 
 
 def get_page_table(file_name: str, page: int, offset: int = 0):
-    pdf_file = pypdf.Document(file_name)
+    pdf_file = _open_document(file_name)
     page_doc = pdf_file[page + offset]
     tabs = page_doc.find_tables()
     return tabs
 
 
 def print_blocks(xml_tree: etree.Element, max_deeph: int = 0) -> None:
-    etree_to_print = copy.deepcopy(xml_tree)
-
-    def _remove_tree_to_depth(elem: etree.Element, depth: int = 0, max_depth: int = 0):
-        for e in list(elem):
-            if depth >= max_depth:
-                elem.remove(e)
-            else:
-                _remove_tree_to_depth(e, depth + 1, max_depth)
-
-    _remove_tree_to_depth(etree_to_print, depth=0, max_depth=max_deeph)
-    print(etree.tostring(etree_to_print, pretty_print=True).decode(), end="")
-    del etree_to_print
+    # only the elements that are printed are copied, not the whole page
+    def _copy_to_depth(elem: etree.Element, depth: int = 0) -> etree.Element:
+        if not isinstance(elem.tag, str):
+            # comments and processing instructions have no children
+            return copy.copy(elem)
+        elem_copy = etree.Element(elem.tag, elem.attrib, nsmap=elem.nsmap)
+        elem_copy.text = elem.text
+        if depth < max_deeph:
+            for e in elem:
+                e_copy = _copy_to_depth(e, depth + 1)
+                e_copy.tail = e.tail
+                elem_copy.append(e_copy)
+        return elem_copy
+
+    etree_to_print = _copy_to_depth(xml_tree)
+    print(etree.tostring(etree_to_print, pretty_print=True, encoding="unicode"), end="")
@@ -67,6 +67,11 @@ def _create_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--config", type=str, help=_("Custom configuration file location")
     )
+    parser.add_argument(
+        "--xml-cache",
+        type=str,
+        help=_("Directory where to cache the pages decoded to xml between runs"),
+    )
     out_csv = DEFAULT_CONFIG["OUT_CSV"]
     parser.add_argument(
         "--out",
@@ -126,6 +131,7 @@ def overwrite_with_args(args, config: dict, config_location: dict) -> Tuple[dict
         ("OUT_CSV", args.out, Path),
         ("BATCH", args.batch, Path),
         ("N_WORKERS", args.workers, int),
+        ("XML_CACHE", args.xml_cache, Path),
     ]:
         config, config_location = _set_str_arg(
             name_conf, value, config, config_location, cast_func
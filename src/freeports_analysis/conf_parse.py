@@ -124,6 +124,7 @@ DEFAULT_CONFIG = {
     "PDF": None,
     "FORMAT": None,
     "CONFIG_FILE": _find_config(),
+    "XML_CACHE": None,
 }
 
 
@@ -137,6 +138,7 @@ schema_yaml_config = {
     "out_path": ("OUT_CSV", Path),
     "save_pdf": ("SAVE_PDF", bool),
     "format": ("FORMAT", lambda x: PdfFormats.__members__[x.strip()]),
+    "xml_cache": ("XML_CACHE", Path),
 }
 
 
@@ -166,6 +168,7 @@ schema_env_config = {
     f"{ENV_PREFIX}FORMAT": ("FORMAT", lambda x: PdfFormats.__members__[x.strip()]),
     f"{ENV_PREFIX}PDF": ("PDF", Path),
     f"{ENV_PREFIX}CONFIG_FILE": ("CONFIG_FILE", Path),
+    f"{ENV_PREFIX}XML_CACHE": ("XML_CACHE", Path),
 }
 
 schema_job_csv_config = {
@@ -5,7 +5,7 @@ should facilitate avoiding circular imports
 from abc import ABC, abstractmethod
 import datetime
 from enum import Enum, auto
-from typing import List
+from typing import Collection
 import logging as log
 import importlib
 
@@ -103,8 +103,8 @@ class FinancialData(ABC):
     ----------
     page : int
         The page number where the financial data appears (must be positive).
-    targets: List[str]
-        The list of companies to search for, used as company validation
+    targets: Collection[str]
+        The companies to search for, used as company validation
     company : str
         The name of the company or issuer.
     market_value : float
@@ -131,7 +131,7 @@ class FinancialData(ABC):
     def __init__(
         self,
         page: int,
-        targets: List[str],
+        targets: Collection[str],
         company: str,
         subfund: str,
         nominal_quantity: int,
@@ -314,7 +314,7 @@ class Bond(FinancialData):
     def __init__(
         self,
         page: int,
-        targets: List[str],
+        targets: Collection[str],
         company: str,
         subfund: str,
         nominal_quantity: int,
@@ -331,8 +331,8 @@ class Bond(FinancialData):
         ----------
         page : int
             The page number where the bond appears.
-        targets: List[str]
-            The list of companies to search for, used as company validation
+        targets: Collection[str]
+            The companies to search for, used as company validation
         company : str
             The issuer of the bond.
         market_value : float
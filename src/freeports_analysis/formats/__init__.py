@@ -1,14 +1,29 @@
 """Module common to each format, it contains the definitions used by all the formats"""
 
+from contextlib import contextmanager
 from enum import Enum
-from typing import Optional, List, Callable
+from typing import Optional, List, Callable, Iterator, Iterable
 import logging as log
 from lxml import etree
 from freeports_analysis.consts import FinancialData
 from freeports_analysis.i18n import _
 
+__all__ = [
+    "LogFormatterWithPage",
+    "PdfBlock",
+    "TextBlock",
+    "pdf_filter_exec",
+    "text_extract_exec",
+    "deserialize_exec",
+    "ExpectedPdfBlockNotFound",
+    "ExpectedTextBlockNotFound",
+]
+
 logger = log.getLogger(__name__)
 
+# the glyphs of a line, collected by libxml2 in a single call
+_chars_text = etree.XPath(".//char/@c", smart_strings=False)
+
 
 class LogFormatterWithPage(log.Formatter):
     """Formatter that inherit the behaviour from
@@ -29,6 +44,16 @@ class LogFormatterWithPage(log.Formatter):
         self._parent_fmt = old_formatter
         self.page = None
 
+    @property
+    def page(self) -> Optional[int]:
+        """Optional[int]: page number inserted in the formatted records"""
+        return self._page
+
+    @page.setter
+    def page(self, page: Optional[int]):
+        self._page = page
+        self._page_tag = f"{{pag. {page}}}:"
+
     def format(self, record: log.LogRecord) -> str:
         """Method used to get the rappresentation of the report.
         overwrite the inherited one
@@ -43,11 +68,37 @@ class LogFormatterWithPage(log.Formatter):
         str
             formatted version of the record
         """
-        string = self._parent_fmt.format(record).replace(":", f"{{pag. {self.page}}}:")
+        string = self._parent_fmt.format(record).replace(":", self._page_tag, 1)
         return string
 
 
-def _str_blocks(blk) -> str:
+@contextmanager
+def _page_logging() -> Iterator[LogFormatterWithPage]:
+    """Temporarily route the records of this module through a
+    `LogFormatterWithPage` based on the formatter of the parent logger
+
+    Yields
+    ------
+    LogFormatterWithPage
+        formatter whose `page` should be updated while processing pages
+    """
+    parent_handlers = logger.parent.handlers
+    page_format_log = LogFormatterWithPage(
+        parent_handlers[0].formatter if len(parent_handlers) > 0 else log.Formatter()
+    )
+    std_err_log = log.StreamHandler()
+    std_err_log.setFormatter(page_format_log)
+    propagate = logger.propagate
+    logger.propagate = False
+    logger.addHandler(std_err_log)
+    try:
+        yield page_format_log
+    finally:
+        logger.removeHandler(std_err_log)
+        logger.propagate = propagate
+
+
+def _str_blocks(blk: "PdfBlock | TextBlock") -> str:
     """Basic function to format both PdfBlock and TextBlock
     for string rappresentation
 
@@ -73,12 +124,40 @@ def _str_blocks(blk) -> str:
     return text
 
 
-def _eq_blocks(a, b) -> bool:
-    equal = True
-    equal = equal and a.type_block == b.type_block
-    equal = equal and a.metadata == b.metadata
-    equal = equal and a.content == b.content
-    return equal
+def _check_element(ele: etree.Element) -> None:
+    """Fail early on what is not an XML element, instead of when the content
+    of the block is first read
+
+    Raises
+    ------
+    TypeError
+        If `ele` is not an XML element.
+    """
+    if not etree.iselement(ele):
+        raise TypeError(_("Expected an XML element, not {}").format(type(ele).__name__))
+
+
+def _eq_blocks(a: "PdfBlock | TextBlock", b: "PdfBlock | TextBlock") -> bool:
+    """Basic function to compare both PdfBlock and TextBlock,
+    the cheap fields are compared before the content
+
+    Parameters
+    ----------
+    a : PdfBlock | TextBlock
+        first block to compare
+    b : PdfBlock | TextBlock
+        second block to compare
+
+    Returns
+    -------
+    bool
+        True if type, metadata and content are equal
+    """
+    return (
+        a.type_block == b.type_block
+        and a.metadata == b.metadata
+        and a.content == b.content
+    )
 
 
 class PdfBlock:
@@ -91,15 +170,18 @@ class PdfBlock:
         The type of the PDF block.
     metadata : Optional[dict]
         Additional metadata associated with the block.
-    content : Optional[str]
-        The textual content extracted from the block.
+    content : str
+        The textual content extracted from the block, computed from the
+        XML element the first time it is accessed (see also `from_elements`).
     """
 
+    __slots__ = ("type_block", "metadata", "_xml_ele", "_content")
+
     type_block: Enum
     metadata: Optional[dict]
-    content: Optional[str]
 
-    def _text_form_element(self, ele: etree.Element) -> str:
+    @staticmethod
+    def _text_form_element(ele: etree.Element) -> str:
         """Extracts text content from an XML element representing a PDF block.
 
         Args
@@ -112,20 +194,13 @@ class PdfBlock:
         str
             The extracted text content.
         """
-        text = ""
         if ele.tag == "line":
             lines = [ele]
         else:
             lines = ele.findall("line")
-        for line in lines:
-            for e in line.findall(".//char"):
-                c = e.get("c")
-                if c is not None:
-                    text += c
-            text += "\n"
-        return text
-
-    def __eq__(self, other):
+        return "".join("".join(_chars_text(line)) + "\n" for line in lines)
+
+    def __eq__(self, other: "PdfBlock") -> bool:
         """Compares two PdfBlock instances for equality.
 
         Parameters
@@ -145,7 +220,8 @@ class PdfBlock:
         self,
         type_block: Enum,
         metadata: dict,
-        xml_ele: etree.Element | List[etree.Element],
+        xml_ele: etree.Element,
+        content: Optional[str] = None,
     ):
         """Initializes a PdfBlock instance.
 
@@ -155,18 +231,102 @@ class PdfBlock:
             The type of the PDF block.
         metadata : dict
             Additional metadata for the block.
-        xml_ele : etree.Element | List[etree.Element]
-            The XML element(s) containing the block's content.
+        xml_ele : etree.Element
+            The XML element containing the block's content.
+        content : Optional[str]
+            The textual content of the block, if already known by the caller,
+            so that it is not extracted again from `xml_ele`.
+
+        Raises
+        ------
+        TypeError
+            If `xml_ele` is not an XML element, several elements are joined
+            in a block with `from_elements`.
         """
+        _check_element(xml_ele)
         self.type_block = type_block
         self.metadata = metadata
-        txt = ""
-        if isinstance(xml_ele, list):
-            for ele in xml_ele:
-                txt += self._text_form_element(ele)
-        else:
-            txt = self._text_form_element(xml_ele)
-        self.content = txt
+        # the element (and so its whole tree) is only kept until the content is known
+        self._xml_ele = xml_ele if content is None else None
+        self._content = content
+
+    @classmethod
+    def from_elements(
+        cls, type_block: Enum, metadata: dict, xml_eles: List[etree.Element]
+    ) -> "PdfBlock":
+        """Creates a PdfBlock spanning several XML elements,
+        whose content is the concatenation of the content of each one.
+
+        Parameters
+        ----------
+        type_block : Enum
+            The type of the PDF block.
+        metadata : dict
+            Additional metadata for the block.
+        xml_eles : List[etree.Element]
+            The XML elements containing the block's content, in order.
+
+        Returns
+        -------
+        PdfBlock
+            The block built from the elements.
+
+        Raises
+        ------
+        ValueError
+            If `xml_eles` is empty.
+        TypeError
+            If one of `xml_eles` is not an XML element.
+        """
+        if len(xml_eles) == 0:
+            raise ValueError(_("Expected at least one XML element"))
+        for ele in xml_eles:
+            _check_element(ele)
+        content = "".join(cls._text_form_element(ele) for ele in xml_eles)
+        # the content covers all the elements, so none of them is kept
+        return cls(type_block, metadata, xml_eles[0], content)
+
+    @property
+    def content(self) -> str:
+        """str: The textual content extracted from the block."""
+        if self._content is None:
+            self._content = self._text_form_element(self._xml_ele)
+            self._xml_ele = None
+        return self._content
+
+    @content.setter
+    def content(self, content: str):
+        self._content = content
+        self._xml_ele = None
+
+    def __getstate__(self) -> dict:
+        """Materialize the content and drop the XML element(s),
+        that cannot be pickled.
+
+        Returns
+        -------
+        dict
+            The state of the block, with the same layout it had before
+            having `__slots__`.
+        """
+        return {
+            "type_block": self.type_block,
+            "metadata": self.metadata,
+            "content": self.content,
+        }
+
+    def __setstate__(self, state: dict):
+        """Restores the state of the PdfBlock from a dictionary.
+
+        Parameters
+        ----------
+        state : dict
+            The state of the block.
+        """
+        self.type_block = state["type_block"]
+        self.metadata = state["metadata"]
+        self._xml_ele = None
+        self._content = state["content"]
 
     def __str__(self) -> str:
         """Returns a string representation of the PdfBlock.
@@ -194,6 +354,9 @@ class TextBlock:
         The original PdfBlock this text was derived from.
     """
 
+    # one is created per relevant row of the report, so no per instance `__dict__`
+    __slots__ = ("type_block", "metadata", "content", "pdf_block")
+
     type_block: Enum
     metadata: dict
     content: str
@@ -216,6 +379,28 @@ class TextBlock:
         self.pdf_block = pdf_block
         self.content = pdf_block.content
 
+    def __getstate__(self) -> dict:
+        """Returns the state of the TextBlock as a dictionary,
+        the same layout it had before having `__slots__`.
+
+        Returns
+        -------
+        dict
+            The state of the block.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state: dict):
+        """Restores the state of the TextBlock from a dictionary.
+
+        Parameters
+        ----------
+        state : dict
+            The state of the block.
+        """
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def __str__(self) -> str:
         """Returns a string representation of the TextBlock.
 
@@ -226,7 +411,7 @@ class TextBlock:
         """
         return _str_blocks(self)
 
-    def __eq__(self, other):
+    def __eq__(self, other: "TextBlock") -> bool:
         """Compares two TextBlock instances for equality.
 
         Args
@@ -245,24 +430,25 @@ class TextBlock:
 
 
 def pdf_filter_exec(
-    batch_pages: List[str],
+    batch_pages: Iterable[etree.Element],
     i_batch_page: int,
     n_pages: int,
-    pdf_filter_func: Callable[[List[str]], List[PdfBlock]],
+    pdf_filter_func: Callable[[etree.Element], List[PdfBlock]],
 ) -> List[PdfBlock]:
     """Processes a PDF document through a filter function to extract relevant blocks.
 
     Args
     ----
 
-    document : List[str]
-        The PDF document to process as a list of xml pages.
+    batch_pages : Iterable[etree.Element]
+        The pages of the PDF document to process as parsed xml trees, they are
+        consumed one at a time so they can also be produced lazily.
     i_batch_page : int
         Starting page of the batch processed by the instance of `pdf_filter_exec` function,
         used for informative purposes
     n_pages : int
         Total number of pages in the document, used for informative purposes.
-    pdf_filter_func : Callable[[List[str]], List[PdfBlock]]
+    pdf_filter_func : Callable[[etree.Element], List[PdfBlock]]
         A function that takes an XML element and returns a list of relevant PdfBlock.
 
     Returns
@@ -271,20 +457,26 @@ def pdf_filter_exec(
         PdfBlock objects containing the filtered content.
     """
     batch_results = []
-    logger.propagate = False
-    std_err_log = log.StreamHandler()
-    page_format_log = LogFormatterWithPage(logger.parent.handlers[0].formatter)
-    std_err_log.setFormatter(page_format_log)
-    logger.addHandler(std_err_log)
-
-    for page_number, page in enumerate(batch_pages, start=i_batch_page + 1):
-        page_format_log.page = page_number
-        if (page_number + i_batch_page) % (n_pages // min(10, n_pages)) == 0:
-            logger.info(_("Still filtering..."))
-
-        for r in pdf_filter_func(page):
-            r.metadata["page"] = page_number
-            batch_results.append(r)
+    # report progress roughly every tenth of the document, only if it would be shown
+    report_pages = frozenset()
+    if logger.isEnabledFor(log.INFO):
+        report_step = max(1, n_pages // 10)
+        report_pages = frozenset(range(report_step, n_pages + 1, report_step))
+    still_filtering_msg = _("Still filtering...")
+
+    with _page_logging() as page_format_log:
+        for page_number, page in enumerate(batch_pages, start=i_batch_page + 1):
+            page_format_log.page = page_number
+            if page_number in report_pages:
+                logger.info(still_filtering_msg)
+
+            page_results = pdf_filter_func(page)
+            for r in page_results:
+                r.metadata["page"] = page_number
+                # every block returned is read by the text extraction: reading
+                # the content now releases the page tree before the next is parsed
+                r.content
+            batch_results.extend(page_results)
     return batch_results
 
 
@@ -316,9 +508,11 @@ def deserialize_exec(
     text_blocks: List[TextBlock],
     targets: List[str],
     deserialize_func: Callable[[TextBlock, List[str]], FinancialData],
-) -> List[FinancialData]:
+) -> Iterator[FinancialData]:
     """Converts TextBlocks into tabular data using a specified function that
     from an expected formatting, return a python object.
+    The conversion is lazy, so that each object can be consumed (e.g. turned into
+    a row of a table) before the next one is created.
 
     Args
     ----
@@ -331,10 +525,13 @@ def deserialize_exec(
 
     Returns
     -------
-    List[FinancialData]
+    Iterator[FinancialData]
         FinantialData classes containing the deserialized data.
     """
-    return [deserialize_func(txtblk, targets) for txtblk in text_blocks]
+    # each FinancialData validates its company against the targets:
+    # build the lookup set once for the whole batch
+    targets = frozenset(targets)
+    return (deserialize_func(txtblk, targets) for txtblk in text_blocks)
 
 
 class ExpectedPdfBlockNotFound(Exception):
@@ -1,8 +1,20 @@
+"""Default format submodule, the stub every format has to implement.
+Each function raises `NotImplementedError`."""
+
 from enum import Enum
-from lxml import etree
 from typing import List
+from lxml import etree
+from freeports_analysis.consts import FinancialData
 from .. import PdfBlock, TextBlock
 
+__all__ = [
+    "pdf_filter",
+    "text_extract",
+    "deserialize",
+    "PdfBlockType",
+    "TextBlockType",
+]
+
 
 def pdf_filter(xml_root: etree.Element) -> List[PdfBlock]:
     raise NotImplementedError
@@ -12,7 +24,7 @@ def text_extract(pdf_blocks: List[PdfBlock], targets: List[str]) -> List[TextBlo
     raise NotImplementedError
 
 
-def deserialize(TextBlock: TextBlock) -> dict:
+def deserialize(text_block: TextBlock, targets: List[str]) -> FinancialData:
     raise NotImplementedError
 
 
@@ -37,7 +37,7 @@ def pdf_filter(xml_root) -> dict:
     lines = get_lines_with_font(xml_root, "ArialNarrow")
     lines = [ExtractedPdfLine(line) for line in lines]
     y_range = YRange(None, 208)
-    currency = select_inside(lines, y_range)[0].xml_blk.xpath(".//@text")[0]
+    currency = select_inside(lines, y_range)[0].txt
     return {"currency": currency}
 
 
@@ -42,8 +42,11 @@ def pdf_filter(xml_root) -> dict:
     perc_net_assets_pos=+4,
     currency=+1,
     acquisition_cost_pos=None,
-    match_func=lambda x, y: target_fuzzy_match(x, y, 0.8)
-    and target_prefix_match(x, y, 0.3),
+    match_func=lambda x, y: (
+        target_fuzzy_match(x, y, 0.8, normalized=True)
+        and target_prefix_match(x, y, 0.3, normalized=True)
+    ),
+    normalized_match=True,
 )
 def text_extract(pdf_blocks, targets):
     pass
@@ -44,8 +44,11 @@ def pdf_filter(xml_root) -> dict:
     perc_net_assets_pos=+3,
     currency=Currency.EUR,
     acquisition_cost_pos=None,
-    match_func=lambda x, y: target_fuzzy_match(x, y, 0.65)
-    and target_prefix_match(x, y, 0.3),
+    match_func=lambda x, y: (
+        target_fuzzy_match(x, y, 0.65, normalized=True)
+        and target_prefix_match(x, y, 0.3, normalized=True)
+    ),
+    normalized_match=True,
 )
 def text_extract(pdf_blocks, targets):
     pass
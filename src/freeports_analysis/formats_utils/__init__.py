@@ -21,11 +21,10 @@ def normalize_string(string: str, lower: bool = True) -> str:
     str
         Normalized string
     """
-    string = string.strip()
+    # `split()` without arguments already drops leading/trailing whitespace
     if lower:
         string = string.lower()
-    string = " ".join(string.split())
-    return string
+    return " ".join(string.split())
 
 
 def normalize_word(word: str, lower: bool = False) -> str:
@@ -43,7 +42,6 @@ def normalize_word(word: str, lower: bool = False) -> str:
     str
         Normalized word with no whitespace
     """
-    word = word.strip()
     word = "".join(word.split())
     if lower:
         word = word.lower()
@@ -12,6 +12,13 @@ from . import normalize_word, overwrite_if_implemented, normalize_string
 
 logger = getLogger(__name__)
 
+_numeric_reg = re.compile(r"^\d+([\.,]\d+)*$")
+_not_numeric_reg = re.compile(r"[^a-zA-Z.,0-9]+")
+# dot separated thousands, a float needs at least two groups to not be
+# confused with a decimal number
+_float_thousands_reg = re.compile(r"^[1-9]\d{0,2}\.\d{3}(\.\d{3})+$")
+_int_thousands_reg = re.compile(r"^[1-9]\d{0,2}(\.\d{3})+$")
+
 
 def perc_to_float(perc: str, norm: bool = True) -> float:
     """Convert a percentage string to float value.
@@ -43,8 +50,8 @@ def perc_to_float(perc: str, norm: bool = True) -> float:
 
     # Handle percentage sign
     if "%" in perc:
+        # `perc` has no whitespace left, removing the sign cannot add any
         perc = perc.replace("%", "")
-        perc = normalize_word(perc)
         if not norm:
             logger.warning(
                 _(
@@ -54,7 +61,7 @@ def perc_to_float(perc: str, norm: bool = True) -> float:
         norm = True
 
     try:
-        f = to_float(perc)
+        f = _parse_float(perc)
         return f / 100.0 if norm else f
     except ValueError as e:
         logger.error(_("Failed to convert percentage string '%f' to float"), perc)
@@ -62,11 +69,10 @@ def perc_to_float(perc: str, norm: bool = True) -> float:
 
 
 def _force_numeric(data: str) -> str:
-    reg_num = r"^\d+([\.,]\d+)*$"
-    data = normalize_word(data)
-    if not re.match(reg_num, data):
+    # `data` is expected to be already normalized by `normalize_word`
+    if not _numeric_reg.match(data):
         logger.warning(_("Trying to cast to number but found %s forcing cast..."), data)
-        data = re.sub(r"[^a-zA-Z.,0-9]+", "", data)
+        data = _not_numeric_reg.sub("", data)
     return data
 
 
@@ -90,7 +96,11 @@ def to_float(data: str) -> float:
     ValueError
         the resulting processed string cannot be casted to `float`
     """
-    data = normalize_word(data)
+    return _parse_float(normalize_word(data))
+
+
+def _parse_float(data: str) -> float:
+    # body of `to_float` for strings already normalized by `normalize_word`
     data = _force_numeric(data)
     pos_dot = data.find(".")
     pos_com = data.find(",")
@@ -99,8 +109,7 @@ def to_float(data: str) -> float:
         data = data.replace(data[first_pos], "")
 
     data = data.replace(",", ".")
-    int_reg = r"^[1-9]\d{0,2}\.\d{3}(\.\d{3})+$"
-    if re.match(int_reg, data):
+    if _float_thousands_reg.match(data):
         data = data.replace(".", "")
     return float(data)
 
@@ -124,8 +133,7 @@ def to_int(data: str) -> int:
     ValueError
         the resulting processed string cannot be casted to `int`
     """
-    data = normalize_word(data)
-    data = _force_numeric(data)
+    data = _force_numeric(normalize_word(data))
     pos_dot = data.find(".")
     pos_com = data.find(",")
     if pos_dot != -1 and pos_com != -1:
@@ -133,8 +141,7 @@ def to_int(data: str) -> int:
         data = data.replace(data[first_pos], "")
 
     data = data.replace(",", ".")
-    int_reg = r"^[1-9]\d{0,2}(\.\d{3})+$"
-    if re.match(int_reg, data):
+    if _int_thousands_reg.match(data):
         data = data.replace(".", "")
 
     pos_dot = data.find(".")
@@ -244,6 +251,22 @@ def standard_deserialization(
         A decorator that takes a function and returns a deserializer function
     """
 
+    # the casts depend only on the factory arguments, resolve them once
+    # instead of checking the flags for each value of each block
+    if cost_and_value_interpret_int:
+
+        def float_cast(x):
+            return float(to_int(x))
+    else:
+        float_cast = to_float
+
+    if quantity_interpret_float:
+
+        def int_cast(x):
+            return int(to_float(x))
+    else:
+        int_cast = to_int
+
     def wrapper(f):
         @overwrite_if_implemented(f)
         def default_other_txt_blk_deserializer(
@@ -271,17 +294,6 @@ def standard_deserialization(
             if blk is None:
                 logger.error(_("Something wrong happened, text block is None..."))
             md = blk.metadata
-
-            def float_cast(x):
-                if cost_and_value_interpret_int:
-                    return float(to_int(x))
-                return to_float(x)
-
-            def int_cast(x):
-                if quantity_interpret_float:
-                    return int(to_float(x))
-                return to_int(x)
-
             try:
                 ac = (
                     float_cast(md["acquisition cost"])
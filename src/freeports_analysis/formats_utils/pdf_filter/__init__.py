@@ -1,11 +1,17 @@
 """Utilities for writing `pdf_filter` functions"""
 
+import sys
+from contextvars import ContextVar
 from typing import List, Optional, Tuple, TypeAlias, Callable
 from enum import Enum, auto
 from lxml import etree
 from freeports_analysis.formats import PdfBlock, ExpectedPdfBlockNotFound, TextBlock
 from freeports_analysis.i18n import _
-from .xml.font import get_lines_with_font, is_present_txt_font, get_lines_with_txt_font
+from .xml.font import (
+    get_lines_with_font,
+    is_present_txt_font,
+    get_lines_with_txt_font,
+)
 from .select_position import select_inside, get_table_positions
 from .pdf_parts.position import YRange
 from .pdf_parts.font import Font
@@ -19,6 +25,49 @@ FilterCondition: TypeAlias = Callable[[etree.Element], bool]
 PdfFilterFunc: TypeAlias = Callable[[etree.Element], List[TextBlock]]
 
 
+# lines built for the page that `filter_page_if` is filtering, by font: subfund
+# and body lines often share a font, so they are built (and their bounds parsed)
+# once per page; the page and its cache only live as long as that call
+_page_lines: ContextVar[Optional[Tuple[etree.Element, dict]]] = ContextVar(
+    "_page_lines", default=None
+)
+
+
+def _extracted_lines(
+    xml_root: etree.Element, font: str
+) -> Tuple[ExtractedPdfLine, ...]:
+    page_lines = _page_lines.get()
+    if page_lines is not None and page_lines[0] is xml_root:
+        lines_by_font = page_lines[1]
+    else:
+        lines_by_font = {}
+    lines = lines_by_font.get(font)
+    if lines is None:
+        lines = tuple(
+            ExtractedPdfLine(blk) for blk in get_lines_with_font(xml_root, font)
+        )
+        lines_by_font[font] = lines
+    return lines
+
+
+def _resolve_limit(
+    xml_root: etree.Element,
+    limit_line: Optional[Tuple[str, str]],
+    fixed: Optional[float],
+    is_top: bool,
+) -> Optional[float]:
+    # a limit is either fixed or given by the line with a certain (txt, font):
+    # the rows are below the bottom of a top limit line and above the top of a
+    # bottom one, if the line is not in the page the limit is not applied
+    if limit_line is None:
+        return fixed
+    txt, font = limit_line
+    limit_blk = get_lines_with_txt_font(xml_root, txt, font)
+    if limit_blk is None:
+        return None
+    return get_bounds(limit_blk)[1][1 if is_top else 0]
+
+
 class OnePdfBlockType(Enum):
     """Enum representing one type of pdf blocks in document processing.
 
@@ -57,8 +106,12 @@ def filter_page_if(
     def wrapper(pdf_filter: PdfFilterFunc) -> PdfFilterFunc:
         def conditionated_pdf_filter(xml_root: etree.Element) -> List[PdfBlock]:
             parts = []
-            if condition(xml_root):
-                parts = pdf_filter(xml_root)
+            token = _page_lines.set((xml_root, {}))
+            try:
+                if condition(xml_root):
+                    parts = pdf_filter(xml_root)
+            finally:
+                _page_lines.reset(token)
             return parts
 
         return conditionated_pdf_filter
@@ -87,12 +140,11 @@ def standard_extraction_subfund(
 
     def decorator(old_page_metadata):
         def new_page_metadata(xml_root: etree.Element) -> List[PdfBlock]:
-            lines_with_font = get_lines_with_font(xml_root, subfund_font)
-            lines = [ExtractedPdfLine(blk) for blk in lines_with_font]
+            lines = _extracted_lines(xml_root, subfund_font)
             top_lines = select_inside(lines, subfund_height)
             subfund = None
             if len(top_lines) > 0:
-                subfund = top_lines[0].xml_blk.xpath(".//@text")[0]
+                subfund = top_lines[0].txt
             if subfund is None:
                 raise ExpectedPdfBlockNotFound(
                     _("subfound block on top of page not found")
@@ -149,6 +201,18 @@ def standard_pdf_filtering(
     The decorated function can override:
     - page_metadata(): returns additional metadata dictionary for each page
     """
+    if deselection_list is not None:
+        deselection_list = frozenset(
+            (txt, sys.intern(font)) for txt, font in deselection_list
+        )
+    # split once the vertical limits in the fixed ones and the ones
+    # that have to be searched in each page as lines with a (txt, font)
+    y_top, y_btm = (None, None) if y_range is None else y_range
+    top_limit_line = y_top if isinstance(y_top, tuple) else None
+    btm_limit_line = y_btm if isinstance(y_btm, tuple) else None
+    top_fixed = None if top_limit_line is not None else y_top
+    btm_fixed = None if btm_limit_line is not None else y_btm
+    block_type = OnePdfBlockType.RELEVANT_BLOCK
 
     def decorator(f):
         @standard_extraction_subfund(subfund_height, subfund_font)
@@ -159,42 +223,29 @@ def standard_pdf_filtering(
         @filter_page_if(lambda x: is_present_txt_font(x, header_txt, header_font))
         def pdf_filter(xml_root: etree.Element) -> List[PdfBlock]:
             metadata = page_metadata(xml_root)
-            rows = get_lines_with_font(xml_root, body_font)
-            lines = [ExtractedPdfLine(r) for r in rows]
-            y_range_numeric_top = None
-            y_range_numeric_btm = None
+            lines = _extracted_lines(xml_root, body_font)
 
             if deselection_list is not None:
                 lines = deselect_txt_font(
                     deselection_list=deselection_list, lines=lines
                 )
 
-            if y_range is not None:
-                if isinstance(y_range[0], tuple):
-                    txt, font = y_range[0]
-                    top_limit_blk = get_lines_with_txt_font(xml_root, txt, font)
-                    if top_limit_blk is not None:
-                        y_range_numeric_top = get_bounds(top_limit_blk)[1][1]
-                else:
-                    y_range_numeric_top = y_range[0]
-                if isinstance(y_range[1], tuple):
-                    txt, font = y_range[1]
-                    btm_limit_blk = get_lines_with_txt_font(xml_root, txt, font)
-                    if btm_limit_blk is not None:
-                        y_range_numeric_btm = get_bounds(btm_limit_blk)[1][0]
-                else:
-                    y_range_numeric_btm = y_range[1]
+            y_range_numeric_top = _resolve_limit(
+                xml_root, top_limit_line, top_fixed, True
+            )
+            y_range_numeric_btm = _resolve_limit(
+                xml_root, btm_limit_line, btm_fixed, False
+            )
             table_rows = select_inside(
                 lines, YRange(y_range_numeric_top, y_range_numeric_btm)
             )
             table_positions = get_table_positions(table_rows)
+            # the content is joined from the chars of the line and not taken
+            # from its text attribute: pymupdf writes U+FFFD there for some
+            # glyphs that the chars keep (e.g. `\x02` as quotes)
             return [
-                PdfBlock(
-                    OnePdfBlockType.RELEVANT_BLOCK,
-                    {**metadata, "table-col": table_positions[i]},
-                    table_row.xml_blk,
-                )
-                for i, table_row in enumerate(table_rows)
+                PdfBlock(block_type, {**metadata, "table-col": col}, row.xml_blk)
+                for row, col in zip(table_rows, table_positions)
             ]
 
         return pdf_filter
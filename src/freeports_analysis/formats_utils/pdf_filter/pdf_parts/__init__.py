@@ -1,12 +1,20 @@
 """Pdf xml parts in a friendly format (custom python classes)."""
 
+import sys
 from lxml import etree
 from freeports_analysis.i18n import _
 from .font import Font, TextSize
-from ..xml.position import get_bounds
+from ..xml.position import get_bbox
+from ..xml.font import get_txt
 from .position import Area, XRange, YRange, Coord
 
 
+# corners and center, formatted in a single operation
+_COORDS_FORMAT = (
+    "\t(%.3f, %.3f)\t(%.3f, %.3f)\n\t\t(%.3f, %.3f)\n\t(%.3f, %.3f)\t(%.3f, %.3f)\n"
+)
+
+
 class ExtractedPdfLine:
     """A class representing a line extracted from a PDF XML structure.
 
@@ -19,6 +27,8 @@ class ExtractedPdfLine:
         The XML element containing the line data.
     """
 
+    __slots__ = ("_blk", "_geometry", "_font", "_txt_size", "_txt")
+
     def __init__(self, blk: etree.Element):
         """Initialize the ExtractedPdfLine from an XML element.
 
@@ -28,12 +38,25 @@ class ExtractedPdfLine:
             The XML element containing the line data.
         """
         self._blk = blk
-        bounds = get_bounds(blk)
-        self._geometry = Area(
-            XRange(bounds[0][0], bounds[0][1]), YRange(bounds[1][0], bounds[1][1])
-        )
-        self._font = Font(blk.xpath(".//font/@name")[0])
-        self._txt_size = TextSize(blk.xpath(".//font/@size")[0])
+        x0, y0, x1, y1 = get_bbox(blk)
+        self._geometry = Area(XRange(x0, x1), YRange(y0, y1))
+        # as `.//font/@name` and `.//font/@size`: the first font with a name and
+        # the first with a size, usually both on the first font of the line
+        name = size = None
+        for font in blk.iterdescendants("font"):
+            if name is None:
+                name = font.get("name")
+            if size is None:
+                size = font.get("size")
+            if name is not None and size is not None:
+                break
+        else:
+            raise IndexError(_("No font name or size found in line"))
+        # font names are a handful per document: interning them makes later
+        # comparisons against the (interned) filter constants a pointer check
+        self._font = sys.intern(Font(name))
+        self._txt_size = TextSize(size)
+        self._txt = get_txt(blk)
 
     @property
     def geometry(self) -> Area:
@@ -91,6 +114,17 @@ class ExtractedPdfLine:
         """
         return self._txt_size
 
+    @property
+    def txt(self) -> str:
+        """Get the text of the line.
+
+        Returns
+        -------
+        str
+            The text of the line.
+        """
+        return self._txt
+
     @property
     def xml_blk(self) -> etree.Element:
         """Get the original XML element containing the line data.
@@ -114,7 +148,6 @@ class ExtractedPdfLine:
         string += f" '{self.font}' [{self.text_size}]\n"
         (((x_tl, y_tl), (x_tr, y_tr)), ((x_bl, y_bl), (x_br, y_br))) = self.corners
         x, y = self.c
-        string += f"\t({x_tl:.3f}, {y_tl:.3f})\t({x_tr:.3f}, {y_tr:.3f})\n"
-        string += f"\t\t({x:.3f}, {y:.3f})\n"
-        string += f"\t({x_bl:.3f}, {y_bl:.3f})\t({x_br:.3f}, {y_br:.3f})\n"
+        coords = (x_tl, y_tl, x_tr, y_tr, x, y, x_bl, y_bl, x_br, y_br)
+        string += _COORDS_FORMAT % coords
         return string
@@ -1,5 +1,7 @@
 """Utilities for handling generic PDF parts and components."""
 
+import math
+
 
 class Range:
     """A class representing a range with start and end values.
@@ -14,6 +16,8 @@ class Range:
         The size of the range (end - start).
     """
 
+    __slots__ = ("_start", "_end", "_low", "_high")
+
     def __init__(self, start: float, end: float):
         """Initialize the Range with start and end values.
 
@@ -26,6 +30,9 @@ class Range:
         """
         self._start = start
         self._end = end
+        # an open side is an infinite limit, so containment is one comparison
+        self._low = -math.inf if start is None else start
+        self._high = math.inf if end is None else end
 
     @property
     def start(self) -> float:
@@ -72,9 +79,7 @@ class Range:
         bool
             True if the value is within the range, False otherwise.
         """
-        return (self.start is None or self.start <= value) and (
-            self.end is None or value <= self.end
-        )
+        return self._low <= value <= self._high
 
     def __str__(self) -> str:
         """Return a string representation of the range.
@@ -15,6 +15,8 @@ class XRange(Range):
         Alias for end of the range.
     """
 
+    __slots__ = ()
+
     @property
     def x0(self) -> float:
         """Get the start value of the X-range.
@@ -47,6 +49,8 @@ class YRange(Range):
         Alias for end of the range.
     """
 
+    __slots__ = ()
+
     @property
     def y0(self) -> float:
         """Get the start value of the Y-range.
@@ -72,6 +76,11 @@ class YRange(Range):
 
 Coord: TypeAlias = Tuple[float, float]
 
+# corners and center, formatted in a single operation
+_AREA_FORMAT = (
+    "|(%.3f, %.3f)\t(%.3f, %.3f)\n|\t(%.3f, %.3f)\n|(%.3f, %.3f)\t(%.3f, %.3f)\n"
+)
+
 
 class Area:
     """A class representing a 2D area defined by X and Y ranges.
@@ -92,6 +101,9 @@ class Area:
         The height of the area (y_bounds.size).
     """
 
+    # one is created per extracted line, so no per instance `__dict__`
+    __slots__ = ("_x_range", "_y_range", "_x0", "_x1", "_y0", "_y1", "_c")
+
     def __init__(self, x_range: XRange, y_range: YRange):
         """Initialize the Area with X and Y ranges.
 
@@ -104,6 +116,12 @@ class Area:
         """
         self._x_range = x_range
         self._y_range = y_range
+        # the ranges do not change: their limits and the center are read once
+        self._x0, self._x1 = x_range.start, x_range.end
+        self._y0, self._y1 = y_range.start, y_range.end
+        self._c = None
+        if None not in (self._x0, self._x1, self._y0, self._y1):
+            self._c = ((self._x1 + self._x0) / 2.0, (self._y1 + self._y0) / 2.0)
 
     @property
     def x_bounds(self) -> XRange:
@@ -136,9 +154,10 @@ class Area:
         Coord
             The (x, y) center coordinate.
         """
-        x = (self.x_bounds.x1 + self.x_bounds.x0) / 2.0
-        y = (self.y_bounds.y1 + self.y_bounds.y0) / 2.0
-        return (x, y)
+        if self._c is None:
+            # unbounded area: fails as the arithmetic with `None` does
+            return ((self._x1 + self._x0) / 2.0, (self._y1 + self._y0) / 2.0)
+        return self._c
 
     @property
     def corners(self) -> Tuple[Tuple[Coord, Coord], Tuple[Coord, Coord]]:
@@ -149,10 +168,7 @@ class Area:
         tuple
             The corner coordinates in the format (((x0,y0), (x1,y0)), ((x0,y1), (x1,y1))).
         """
-        x0 = self.x_bounds.x0
-        x1 = self.x_bounds.x1
-        y0 = self.y_bounds.y0
-        y1 = self.y_bounds.y1
+        x0, x1, y0, y1 = self._x0, self._x1, self._y0, self._y1
         return (((x0, y0), (x1, y0)), ((x0, y1), (x1, y1)))
 
     @property
@@ -164,7 +180,7 @@ class Area:
         float
             The width (x_bounds.size).
         """
-        return self.x_bounds.size
+        return self._x1 - self._x0
 
     @property
     def height(self) -> float:
@@ -175,7 +191,7 @@ class Area:
         float
             The height (y_bounds.size).
         """
-        return self.y_bounds.size
+        return self._y1 - self._y0
 
     def __str__(self) -> str:
         """Return a string representation of the area.
@@ -185,10 +201,6 @@ class Area:
         str
             Formatted string showing corner coordinates and center.
         """
-        string = ""
-        (((x_tl, y_tl), (x_tr, y_tr)), ((x_bl, y_bl), (x_br, y_br))) = self.corners
+        x0, x1, y0, y1 = self._x0, self._x1, self._y0, self._y1
         x, y = self.c
-        string += f"|({x_tl:.3f}, {y_tl:.3f})\t({x_tr:.3f}, {y_tr:.3f})\n"
-        string += f"|\t({x:.3f}, {y:.3f})\n"
-        string += f"|({x_bl:.3f}, {y_bl:.3f})\t({x_br:.3f}, {y_br:.3f})\n"
-        return string
+        return _AREA_FORMAT % (x0, y0, x1, y0, x, y, x0, y1, x1, y1)
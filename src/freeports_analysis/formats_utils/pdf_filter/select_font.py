@@ -22,8 +22,6 @@ def deselect_txt_font(
     List[ExtractedPdfLine]
         filtered list
     """
-    return [
-        line
-        for line in lines
-        if (line.xml_blk.xpath(".//@text")[0], line.font) not in deselection_list
-    ]
+    # membership is tested once per line: hash it instead of scanning a list
+    deselection_set = frozenset(deselection_list)
+    return [line for line in lines if (line.txt, line.font) not in deselection_set]
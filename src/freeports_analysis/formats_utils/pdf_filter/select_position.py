@@ -1,6 +1,7 @@
 """Utilities for selecting or deselecting lines or getting infos based of geometrical information"""
 
 from typing import List
+import numpy as np
 
 from .pdf_parts import ExtractedPdfLine
 from .pdf_parts.position import XRange, YRange
@@ -48,26 +49,6 @@ def select_outside(
     return [line for line in lines if line.c[coord] not in bounds]
 
 
-def _area_position_algorithm(areas, indexes, ruler_geometry, curr_idx, mode_flags):
-    return_columns, use_ruler_pos = mode_flags
-    ruler_pos, ruler_bounds = ruler_geometry
-    # Classify areas
-    for i, area in enumerate(areas):
-        if indexes[i] is not None:
-            continue
-
-        if use_ruler_pos:
-            test_bounds = area.x_bounds if return_columns else area.y_bounds
-            if ruler_pos in test_bounds:
-                indexes[i] = curr_idx
-        else:
-            test_pos = area.c[0] if return_columns else area.c[1]
-            if test_pos in ruler_bounds:
-                indexes[i] = curr_idx
-
-    return indexes
-
-
 def get_table_positions(
     lines: List[ExtractedPdfLine],
     return_columns: bool = True,
@@ -92,45 +73,40 @@ def get_table_positions(
     list of int
         A list of indexes corresponding to each area
     """
-    # Initialize indexes
-    indexes = [None for _ in lines]
-    areas = [line.geometry for line in lines]
-    rulers = []
-
-    # Choose min/max function based on small_rule
-    choose = min if small_rule else max
-
-    while None in indexes:
-        curr_idx = len(rulers)
-        # Get unindexed areas
-        unindexed = [
-            (i, area.width if return_columns else area.height)
-            for i, area in enumerate(areas)
-            if indexes[i] is None
-        ]
-
-        # Select ruler for this axis
-        ruler_idx, _ = choose(unindexed, key=lambda x: x[1])
-        ruler_area = areas[ruler_idx]
-
-        # Get ruler bounds and position
-        ruler_bounds = ruler_area.x_bounds if return_columns else ruler_area.y_bounds
-        ruler_pos = ruler_area.c[0] if return_columns else ruler_area.c[1]
-        rulers.append((curr_idx, ruler_pos))
+    # bounds of the areas along the axis of interest, as columns of floats
+    ranges = [
+        line.geometry.x_bounds if return_columns else line.geometry.y_bounds
+        for line in lines
+    ]
+    low = np.array([r.start for r in ranges], dtype=np.float64)
+    high = np.array([r.end for r in ranges], dtype=np.float64)
+    sizes = high - low
+    centers = (high + low) / 2.0
+
+    indexes = np.zeros(len(lines), dtype=np.intp)
+    unindexed = np.ones(len(lines), dtype=bool)
+    rulers_pos = []
+
+    # Choose min/max function based on small_rule (first one on ties)
+    choose = np.argmin if small_rule else np.argmax
+
+    while unindexed.any():
+        # Select ruler for this axis among the unindexed areas
+        candidates = np.flatnonzero(unindexed)
+        ruler_idx = candidates[choose(sizes[candidates])]
+        ruler_pos = centers[ruler_idx]
 
         # Classify areas
-        indexes = _area_position_algorithm(
-            areas,
-            indexes,
-            (ruler_pos, ruler_bounds),
-            curr_idx,
-            (return_columns, use_ruler_pos),
-        )
-
-    # Sort rulers and create mapping
-    mapping = {
-        old: new for new, (old, _) in enumerate(sorted(rulers, key=lambda x: x[1]))
-    }
-
-    # Apply mapping
-    return [mapping[idx] for idx in indexes]
+        if use_ruler_pos:
+            inside = (low <= ruler_pos) & (ruler_pos <= high)
+        else:
+            inside = (low[ruler_idx] <= centers) & (centers <= high[ruler_idx])
+        new_indexed = unindexed & inside
+        indexes[new_indexed] = len(rulers_pos)
+        unindexed &= ~new_indexed
+        rulers_pos.append(ruler_pos)
+
+    # Rank the rulers by position
+    mapping = np.empty(len(rulers_pos), dtype=np.intp)
+    mapping[np.argsort(rulers_pos, kind="stable")] = np.arange(len(rulers_pos))
+    return mapping[indexes].tolist()
@@ -1,8 +1,29 @@
 """Low level utilities for handling typographic related aspects of the xml tree."""
 
-from typing import List
+from typing import List, Optional
 from lxml import etree
 
+# compiled once, text and font are passed as XPath variables; the font is
+# matched comparing the `name` attributes node-set instead of a nested predicate
+_lines_with_txt_font = etree.XPath(
+    "./descendant-or-self::line[contains(@text, $txt) and font/@name=$font]"
+)
+_lines_with_font = etree.XPath("./descendant-or-self::line[font/@name=$font]")
+_txt = etree.XPath(".//@text", smart_strings=False)
+
+
+def _first_line_with_txt_font(
+    blk: etree.Element, txt: str, font: str
+) -> Optional[etree.Element]:
+    # a walk that stops at the first match: the XPath engine would instead
+    # collect all the matching lines before the first one can be taken
+    for line in blk.iter("line"):
+        if txt in line.get("text", ""):
+            for line_font in line.iterchildren("font"):
+                if line_font.get("name") == font:
+                    return line
+    return None
+
 
 def is_present_txt_font(blk: etree.Element, txt: str, font: str) -> bool:
     """Return if a certain pdf block with a specific text and font is present in the tree
@@ -21,8 +42,7 @@ def is_present_txt_font(blk: etree.Element, txt: str, font: str) -> bool:
     bool
         boolean describing if the block is present or not
     """
-    relevant_part = get_lines_with_txt_font(blk, txt, font, all_elem=True)
-    return len(relevant_part) > 0
+    return _first_line_with_txt_font(blk, txt, font) is not None
 
 
 def get_lines_with_txt_font(
@@ -47,10 +67,9 @@ def get_lines_with_txt_font(
     List[etree.Element] | etree.Element
         matching lines
     """
-    blks = blk.xpath(
-        f"./descendant-or-self::line[contains(@text,'{txt}') and font[@name='{font}']]"
-    )
-    return blks if all_elem else blks[0] if len(blks) > 0 else None
+    if not all_elem:
+        return _first_line_with_txt_font(blk, txt, font)
+    return _lines_with_txt_font(blk, txt=txt, font=font)
 
 
 def get_lines_with_font(blk: etree.Element, font: str) -> List[etree.Element]:
@@ -68,4 +87,24 @@ def get_lines_with_font(blk: etree.Element, font: str) -> List[etree.Element]:
     List[etree.Element]
         list of relevant blocks
     """
-    return blk.xpath(f"./descendant-or-self::line[font[@name='{font}']]")
+    return _lines_with_font(blk, font=font)
+
+
+def get_txt(blk: etree.Element) -> str:
+    """Return the text of a line (the first one found if `blk` is a tree)
+
+    Parameters
+    ----------
+    blk : etree.Element
+        line or tree from which extract the text
+
+    Returns
+    -------
+    str
+        text of the line
+    """
+    # the attribute of a line itself is the first one `.//@text` would find
+    txt = blk.get("text")
+    if txt is None:
+        txt = _txt(blk)[0]
+    return txt
@@ -1,6 +1,20 @@
+import math
 from typing import Optional, Tuple
 from lxml import etree
 
+_bbox = etree.XPath(".//@bbox", smart_strings=False)
+
+
+def _first_bbox(blk: etree.Element) -> str | None:
+    # the attribute of the element itself is the first one `.//@bbox` finds,
+    # reading it directly avoids the XPath evaluation for lines and blocks
+    bbox = blk.get("bbox")
+    if bbox is None:
+        bboxes = _bbox(blk)
+        if bboxes:
+            bbox = bboxes[0]
+    return bbox
+
 
 def is_contained(
     blk: etree.Element,
@@ -21,37 +35,51 @@ def is_contained(
     Returns
     -------
     bool
-        True if entire bbox is within ranges, False otherwise
+        True if entire bbox is within ranges (or no limit is given),
+        False otherwise
     """
-    bounds = get_bounds(blk)
-
-    if x_range is not None:
-        l = x_range[0]
-        r = x_range[1]
-        if l is not None and bounds[0][0] < l:
-            return False
-        if r is not None and bounds[0][1] > r:
-            return False
+    # missing limits are unbounded, so the four checks are a single expression
+    l, r = (None, None) if x_range is None else x_range
+    t, b = (None, None) if y_range is None else y_range
+    if l is None and r is None and t is None and b is None:
+        # nothing to check, the block may even have no bbox
+        return True
+    x0, y0, x1, y1 = get_bbox(blk)
+    return (
+        (-math.inf if l is None else l) <= x0
+        and x1 <= (math.inf if r is None else r)
+        and (-math.inf if t is None else t) <= y0
+        and y1 <= (math.inf if b is None else b)
+    )
+
+
+def get_bbox(blk: etree.Element) -> Tuple[float, float, float, float] | None:
+    """Return the bounding box of a PDF block element as a flat record.
 
-    if y_range is not None:
-        t = y_range[0]
-        b = y_range[1]
-        if t is not None and bounds[1][0] < t:
-            return False
-        if b is not None and bounds[1][1] > b:
-            return False
+    Parameters
+    ----------
+    blk : etree.Element
+        XML element representing the PDF block
 
-    return True
+    Returns
+    -------
+    Tuple[float, float, float, float] | None
+        coordinates (x0, y0, x1, y1), `None` if no 'bbox' attribute is found.
+    """
+    bbox = _first_bbox(blk)
+    if bbox is None:
+        return None
+    x0, y0, x1, y1 = bbox.split()
+    return (float(x0), float(y0), float(x1), float(y1))
 
 
 def get_bounds(blk: etree.Element) -> list | None:
-    bbox = blk.xpath(".//@bbox")
-    if not bbox:
+    bbox = get_bbox(blk)
+    if bbox is None:
         return None
 
-    coords = [float(c) for c in bbox[0].split()]
-    coords = ((coords[0], coords[2]), (coords[1], coords[3]))
-    return coords
+    x0, y0, x1, y1 = bbox
+    return ((x0, x1), (y0, y1))
 
 
 def get_position(blk: etree.Element, mean: bool) -> list | None:
@@ -70,21 +98,14 @@ def get_position(blk: etree.Element, mean: bool) -> list | None:
         Returns None if no 'bbox' attribute is found.
     """
 
-    bbox = blk.xpath(".//@bbox")
-    if not bbox:
+    coords = get_bbox(blk)  # x0, y0, x1, y1
+    if coords is None:
         return None
 
-    coords = [float(c) for c in bbox[0].split()]  # x0, y0, x1, y1
-
     if mean:
         x_center = (coords[0] + coords[2]) / 2
         y_center = (coords[1] + coords[3]) / 2
         coords = (x_center, y_center)
-    else:
-        coords = (
-            ((coords[0], coords[1]), (coords[0], coords[3])),
-            ((coords[2], coords[1]), (coords[2], coords[3])),
-        )
 
     return coords
 
@@ -130,5 +151,7 @@ def get_lines_contained(
     x_range: Optional[Tuple[float, float]] = None,
     y_range: Optional[Tuple[float, float]] = None,
 ):
-    lines = blk.findall(".//line")
-    return [ln for ln in lines if is_contained(ln, x_range, y_range)]
+    # `iterdescendants` walks the tree in C without building the `.//line` list
+    return [
+        ln for ln in blk.iterdescendants("line") if is_contained(ln, x_range, y_range)
+    ]
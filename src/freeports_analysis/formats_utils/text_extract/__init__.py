@@ -8,14 +8,14 @@ This module provides functionality for:
 
 Key components:
 - Matching functions (target_match, target_fuzzy_match, target_prefix_match)
-- Decorators for text block type definition (one_txt_blk, EquityBondTextBlockType)
+- Text block type definition for bond and equity rows (EquityBondTextBlockType)
 - Standard text extraction functionality through standard_text_extraction decorator
 """
 
 from enum import Enum, auto
-import re
+from functools import lru_cache
 import logging
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from freeports_analysis.i18n import _
 from freeports_analysis.formats import TextBlock, PdfBlock
 from freeports_analysis.consts import Currency
@@ -40,7 +40,7 @@ class EquityBondTextBlockType(Enum):
     EQUITY_TARGET = auto()
 
 
-def standard_text_extraction_loop(match_func=target_match):
+def standard_text_extraction_loop(match_func=target_match, normalized_match=False):
     """Decorator for standard text extraction loop.
 
     This decorator wrap the function provide in the usual loop that give a simplify
@@ -60,9 +60,43 @@ def standard_text_extraction_loop(match_func=target_match):
       The wrapped function take as parameters the block list and the index
       of the matched block. It takes the modified list with merged content
       for block in the same column that matches the target.
+
+    The targets matching a given content are memoized, so blocks repeated
+    across pages (headers, footers, recurring holdings) are matched once.
+    If `normalized_match`, `match_func` is given the content and the targets
+    already normalized with `normalize_string`, each normalized once.
     """
 
     def decorator(f):
+        # `targets` are (target, normalized target) pairs, empty targets excluded
+        if match_func is target_match:
+            # exact matching only needs the normalized strings, so the content
+            # is normalized once instead of once for each target
+            def match_all(
+                content: str, targets: Tuple[Tuple[str, str], ...]
+            ) -> Tuple[str, ...]:
+                content = normalize_string(content)
+                return tuple(target for target, norm in targets if norm in content)
+        elif normalized_match:
+
+            def match_all(
+                content: str, targets: Tuple[Tuple[str, str], ...]
+            ) -> Tuple[str, ...]:
+                content = normalize_string(content)
+                return tuple(
+                    target for target, norm in targets if match_func(content, norm)
+                )
+        else:
+
+            def match_all(
+                content: str, targets: Tuple[Tuple[str, str], ...]
+            ) -> Tuple[str, ...]:
+                return tuple(
+                    target for target, _norm in targets if match_func(content, target)
+                )
+
+        matching_targets = lru_cache(maxsize=4096)(match_all)
+
         def text_extract(
             pdf_blocks: List[PdfBlock], targets: List[str]
         ) -> List[TextBlock]:
@@ -70,8 +104,9 @@ def standard_text_extraction_loop(match_func=target_match):
             i = 0
             if len(pdf_blocks) == 0:
                 return text_part_list
+            normalized = ((target, normalize_string(target)) for target in targets)
+            targets = tuple((target, norm) for target, norm in normalized if norm)
             while True:
-                company_name = False
                 split = False
                 current_block = pdf_blocks[i]
                 next_block = pdf_blocks[i + 1]
@@ -81,28 +116,23 @@ def standard_text_extraction_loop(match_func=target_match):
                 if col == next_col:
                     split = True
                     content += pdf_blocks[i + 1].content
-                for target in targets:
-                    target_n = normalize_string(target)
-                    if target_n != "" and match_func(content, target):
-                        company_name = True
-                        if company_name and split:
-                            pdf_blocks[i].content = content
-                            pdf_blocks.pop(i + 1)
-                        txt_blk = f(pdf_blocks, i)
-                        txt_blk.metadata["company"] = target
-                        text_part_list.append(txt_blk)
-                        break
+                matches = matching_targets(content, targets)
+                if len(matches) > 0:
+                    if split:
+                        pdf_blocks[i].content = content
+                        pdf_blocks.pop(i + 1)
+                    txt_blk = f(pdf_blocks, i)
+                    txt_blk.metadata["company"] = matches[0]
+                    text_part_list.append(txt_blk)
                 i += 1
                 if i >= len(pdf_blocks) - 1:
                     break
             if i == len(pdf_blocks) - 1:
                 content = pdf_blocks[-1].content
-                for target in targets:
-                    target_n = normalize_string(target)
-                    if target_n != "" and match_func(content, target):
-                        txt_blk = f(pdf_blocks, i)
-                        txt_blk.metadata["company"] = target
-                        text_part_list.append(txt_blk)
+                for target in matching_targets(content, targets):
+                    txt_blk = f(pdf_blocks, i)
+                    txt_blk.metadata["company"] = target
+                    text_part_list.append(txt_blk)
             return text_part_list
 
         return text_extract
@@ -110,12 +140,83 @@ def standard_text_extraction_loop(match_func=target_match):
     return decorator
 
 
-date_regexes = [
-    r".*(\d{2}[/-]\d{2}[/-]\d{4}).*",
-    r".*(\d{4}[/-]\d{2}[/-]\d{2}).*",
-    r".*(\d{2}[/-]\d{2}[/-]\d{2}).*",
-]
-perc_regexes = [r".*((\d+[\.,]\d+)\s*%).*"]
+# The bond fields are found with plain string scans instead of the regexes
+# `.*(\d{2}[/-]\d{2}[/-]\d{4}).*` (and the other date layouts) and
+# `.*((\d+[\.,]\d+)\s*%).*`: the result is the same, the last match in the
+# content, without backtracking over all of it.
+# digits of the accepted date layouts, in order of preference
+_date_layouts = ((2, 2, 4), (4, 2, 2), (2, 2, 2))
+_date_separators = "/-"
+
+
+def _last_date(content: str, layout: Tuple[int, int, int]) -> Optional[str]:
+    # the date starts a fixed width before its first separator, so scanning
+    # the separators from the right finds the last date of the layout
+    first, second, third = layout
+    length = first + second + third + 2
+    end = len(content)
+    while True:
+        sep = max(content.rfind("/", 0, end), content.rfind("-", 0, end))
+        if sep == -1:
+            return None
+        end = sep
+        start = sep - first
+        if start < 0 or start + length > len(content):
+            continue
+        date = content[start : start + length]
+        if (
+            date[:first].isdecimal()
+            and date[first + 1 : first + 1 + second].isdecimal()
+            and date[first + 1 + second] in _date_separators
+            and date[first + 2 + second :].isdecimal()
+        ):
+            return date
+
+
+def _last_percentage(content: str) -> Optional[str]:
+    # the last match starts with a single digit: had it more, the match
+    # starting one digit later would be valid as well
+    end = len(content)
+    while True:
+        perc = content.rfind("%", 0, end)
+        if perc == -1:
+            return None
+        end = perc
+        decimals_end = perc
+        while decimals_end > 0 and content[decimals_end - 1].isspace():
+            decimals_end -= 1
+        decimals_start = decimals_end
+        while decimals_start > 0 and content[decimals_start - 1].isdecimal():
+            decimals_start -= 1
+        if (
+            decimals_start < decimals_end
+            and decimals_start >= 2
+            and content[decimals_start - 1] in ".,"
+            and content[decimals_start - 2].isdecimal()
+        ):
+            return content[decimals_start - 2 : perc + 1]
+
+
+def _bond_fields(content: str) -> Tuple[Optional[str], Optional[str]]:
+    """Search in the content of a block the fields that identify a bond
+
+    Parameters
+    ----------
+    content : str
+        content of the block
+
+    Returns
+    -------
+    Tuple[Optional[str], Optional[str]]
+        interest rate and maturity, `None` if not found
+    """
+    interest_rate = _last_percentage(content)
+    maturity = None
+    for layout in _date_layouts:
+        maturity = _last_date(content, layout)
+        if maturity is not None:
+            break
+    return interest_rate, maturity
 
 
 def standard_text_extraction(
@@ -125,6 +226,7 @@ def standard_text_extraction(
     currency: Optional[int | Currency] = None,
     acquisition_cost_pos: Optional[int] = None,
     match_func=target_match,
+    normalized_match: bool = False,
 ):
     """Decorator for defining standard text extraction logic
     from PDF blocks based on target matches.
@@ -143,6 +245,10 @@ def standard_text_extraction(
         Relative position for acquisition cost metadata, by default None
     match_func : callable, optional
         Matching function to compare text against targets, by default target_match
+    normalized_match : bool, optional
+        Whether `match_func` takes the text and the target already normalized,
+        so that each is normalized once instead of at every comparison,
+        by default False
 
     Returns
     -------
@@ -164,7 +270,7 @@ def standard_text_extraction(
         def add_metadata(blks: List[PdfBlock], i: int) -> dict:
             return {}
 
-        @standard_text_extraction_loop(match_func)
+        @standard_text_extraction_loop(match_func, normalized_match)
         def text_extract(pdf_blocks: List[PdfBlock], i: int) -> TextBlock:
             if nominal_quantity_pos * market_value_pos * perc_net_assets_pos == 0:
                 raise ValueError(_("All positions must be non-zero"))
@@ -175,13 +281,15 @@ def standard_text_extraction(
             ):
                 raise ValueError(_("All positions should be different"))
 
-            metadata = {}
+            row_metadata = pdf_blocks[i].metadata
             try:
-                metadata["subfund"] = pdf_blocks[i].metadata["subfund"]
-                metadata["page"] = pdf_blocks[i].metadata["page"]
-                metadata["quantity"] = pdf_blocks[i + nominal_quantity_pos].content
-                metadata["market value"] = pdf_blocks[i + market_value_pos].content
-                metadata["% net assets"] = pdf_blocks[i + perc_net_assets_pos].content
+                metadata = {
+                    "subfund": row_metadata["subfund"],
+                    "page": row_metadata["page"],
+                    "quantity": pdf_blocks[i + nominal_quantity_pos].content,
+                    "market value": pdf_blocks[i + market_value_pos].content,
+                    "% net assets": pdf_blocks[i + perc_net_assets_pos].content,
+                }
                 if isinstance(currency, int):
                     metadata["currency"] = pdf_blocks[i + currency].content
                 elif isinstance(currency, Currency):
@@ -195,20 +303,14 @@ def standard_text_extraction(
                 logger.error(str(e))
                 return None
 
-            content = pdf_blocks[i].content
             instrument = EquityBondTextBlockType.EQUITY_TARGET
-            for reg in perc_regexes:
-                interest_rate_match = re.match(reg, content, re.DOTALL)
-                if interest_rate_match:
-                    instrument = EquityBondTextBlockType.BOND_TARGET
-                    metadata["interest rate"] = interest_rate_match[1]
-                    break
-            for reg in date_regexes:
-                date_match = re.match(reg, content, re.DOTALL)
-                if date_match:
-                    instrument = EquityBondTextBlockType.BOND_TARGET
-                    metadata["maturity"] = date_match[1]
-                    break
+            interest_rate, maturity = _bond_fields(pdf_blocks[i].content)
+            if interest_rate is not None:
+                instrument = EquityBondTextBlockType.BOND_TARGET
+                metadata["interest rate"] = interest_rate
+            if maturity is not None:
+                instrument = EquityBondTextBlockType.BOND_TARGET
+                metadata["maturity"] = maturity
 
             metadata.update(add_metadata(pdf_blocks, i))
             return TextBlock(instrument, metadata, pdf_blocks[i])
@@ -1,6 +1,6 @@
 """Functions for different target matching algorithms"""
 
-from difflib import SequenceMatcher
+from rapidfuzz import fuzz
 from .. import normalize_string
 
 
@@ -47,9 +47,17 @@ def target_match(text: str, target: str) -> bool:
     return target in text
 
 
-def target_fuzzy_match(text: str, target: str, ratio: float) -> bool:
+def target_fuzzy_match(
+    text: str, target: str, ratio: float, normalized: bool = False
+) -> bool:
     """Perform fuzzy string matching between normalized text and target.
 
+    The similarity is the normalized Indel similarity of `rapidfuzz.fuzz.ratio`:
+    ``1 - (insertions + deletions) / (len(text) + len(target))``, that is twice
+    the longest common subsequence over the total length. It is never lower
+    than the Ratcliff/Obershelp ratio of `difflib.SequenceMatcher`, so a
+    threshold may accept pairs that `difflib` would reject.
+
     Parameters
     ----------
     text : str
@@ -58,18 +66,24 @@ def target_fuzzy_match(text: str, target: str, ratio: float) -> bool:
         The target string to compare against
     ratio : float
         The minimum similarity ratio threshold (0.0 to 1.0)
+    normalized : bool
+        Whether `text` and `target` are already normalized with `normalize_string`
 
     Returns
     -------
     bool
         True if similarity ratio meets or exceeds threshold, False otherwise
     """
-    text = normalize_string(text)
-    target = normalize_string(target)
-    return SequenceMatcher(None, target, text).ratio() >= ratio
+    if not normalized:
+        text = normalize_string(text)
+        target = normalize_string(target)
+    # `fuzz.ratio` is the indel similarity of the two strings in percent
+    return fuzz.ratio(target, text) / 100 >= ratio
 
 
-def target_prefix_match(text: str, target: str, ratio: float) -> bool:
+def target_prefix_match(
+    text: str, target: str, ratio: float, normalized: bool = False
+) -> bool:
     """Check if the normalized prefix of the target string
     matches the normalized text with a given similarity ratio.
 
@@ -81,12 +95,15 @@ def target_prefix_match(text: str, target: str, ratio: float) -> bool:
         The target string whose prefix is being matched
     ratio : float
         The minimum similarity ratio threshold (0.0 to 1.0) for the prefix match
+    normalized : bool
+        Whether `text` and `target` are already normalized with `normalize_string`
 
     Returns
     -------
     bool
         True if the normalized prefix similarity meets or exceeds the threshold, False otherwise
     """
-    text = normalize_string(text)
-    target = normalize_string(target)
+    if not normalized:
+        text = normalize_string(text)
+        target = normalize_string(target)
     return prefix_similarity(target, text) >= ratio
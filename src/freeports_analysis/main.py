@@ -10,10 +10,15 @@ Example:
 
 import os
 import re
+import gzip
+import zlib
+import tempfile
+import hashlib
 import tarfile
 import shutil
 import logging as log
-from typing import List
+from pathlib import Path
+from typing import List, Optional, Tuple
 from multiprocessing import Pool
 import csv
 from lxml import etree
@@ -53,6 +58,17 @@ stderr_log = log.StreamHandler()
 stderr_log.setFormatter(STANDARD_LOG_FORMATTER)
 logger.addHandler(stderr_log)
 
+# pymupdf xml carries its text in attributes and references no ids nor entities,
+# so the id table and the whitespace-only nodes between elements are never used.
+# The same parser is used by the tests and the devtools to parse the pages
+xml_parser = etree.XMLParser(
+    recover=True,
+    collect_ids=False,
+    huge_tree=True,
+    remove_blank_text=True,
+    resolve_entities=False,
+)
+
 
 class NoPDFormatDetected(Exception):
     """Exception that should rise when the script is not
@@ -61,44 +77,237 @@ class NoPDFormatDetected(Exception):
     """
 
 
+def _document_source(pdf_file: pypdf.Document) -> str | bytes:
+    """Get something from which the document can be opened again in
+    another process, as `pymupdf` documents cannot be pickled
+
+    Parameters
+    ----------
+    pdf_file : pypdf.Document
+        opened document
+
+    Returns
+    -------
+    str | bytes
+        the file name of the document if opened from file, the content otherwise
+    """
+    if pdf_file.stream is not None:
+        return pdf_file.stream
+    return pdf_file.name
+
+
+def _open_document(pdf_source: str | bytes) -> pypdf.Document:
+    """Open a document from the output of `_document_source`
+
+    Parameters
+    ----------
+    pdf_source : str | bytes
+        file name or content of the document
+
+    Returns
+    -------
+    pypdf.Document
+        opened document
+    """
+    if isinstance(pdf_source, bytes):
+        return pypdf.Document(stream=pdf_source)
+    return pypdf.Document(pdf_source)
+
+
+def _document_key(pdf_source: str | bytes) -> str:
+    """Get a key identifying the document content and the `pymupdf` version
+    used to decode it, to name its entry in the xml cache
+
+    Parameters
+    ----------
+    pdf_source : str | bytes
+        file name or content of the document
+
+    Returns
+    -------
+    str
+        hexadecimal digest of the document
+    """
+    content = (
+        pdf_source if isinstance(pdf_source, bytes) else Path(pdf_source).read_bytes()
+    )
+    key = hashlib.blake2b(content, digest_size=16)
+    key.update(pypdf.VersionBind.encode())
+    return key.hexdigest()
+
+
+def _page_xml(
+    pdf_file: pypdf.Document, i_page: int, xml_cache: Optional[Path]
+) -> bytes:
+    """Decode a page of the document to xml, reading it from the cache
+    directory of the document (and filling it) if provided
+
+    Parameters
+    ----------
+    pdf_file : pypdf.Document
+        document containing the page
+    i_page : int
+        index of the page (starting from 0)
+    xml_cache : Optional[Path]
+        cache directory of the document, if `None` the cache is not used
+
+    Returns
+    -------
+    bytes
+        xml of the page
+    """
+    if xml_cache is None:
+        return pdf_file[i_page].get_text("xml").encode()
+    cached_page = xml_cache / f"{i_page}.xml.gz"
+    try:
+        xml = gzip.decompress(cached_page.read_bytes())
+    except FileNotFoundError:
+        xml = None
+    except (OSError, EOFError, zlib.error):
+        xml = b""
+    if xml:
+        return xml
+    if xml is not None:
+        # an unreadable or empty entry is a miss, the page is decoded again
+        # and the entry rewritten
+        logger.warning(_("Invalid xml cache entry %s, decoding the page"), cached_page)
+    xml = pdf_file[i_page].get_text("xml").encode()
+    # write to a file of this call only then rename, so an interrupted run or
+    # another process writing the same page cannot leave a truncated entry
+    with tempfile.NamedTemporaryFile(
+        dir=xml_cache, prefix=f"{i_page}.", suffix=".tmp", delete=False
+    ) as tmp:
+        tmp_page = Path(tmp.name)
+    try:
+        tmp_page.write_bytes(gzip.compress(xml, compresslevel=1))
+        tmp_page.replace(cached_page)
+    finally:
+        tmp_page.unlink(missing_ok=True)
+    return xml
+
+
+def _batch_ranges(pdf_file: pypdf.Document, n_batches: int) -> List[Tuple[int, int]]:
+    """Split the pages of the document in contiguous batches of similar cost,
+    estimated with the size of the pages content streams (that is cheap to read,
+    while the decoding to xml of the pages is the expensive part of the processing)
+
+    Parameters
+    ----------
+    pdf_file : pypdf.Document
+        document to split
+    n_batches : int
+        number of batches
+
+    Returns
+    -------
+    List[Tuple[int, int]]
+        for each batch the index of the first page (starting from 0)
+        and the number of pages, empty batches are left out
+    """
+    n_pages = pdf_file.page_count
+    if n_pages == 0:
+        return []
+    costs = []
+    for i_page in range(n_pages):
+        page = pdf_file.load_page(i_page)
+        contents = page.get_contents()
+        costs.append(1 + sum(len(pdf_file.xref_stream_raw(x)) for x in contents))
+    total_cost = sum(costs)
+    n_batch_pages = [0] * n_batches
+    cumulative_cost = 0
+    for cost in costs:
+        # each page goes in the batch where its middle falls, so batches are contiguous
+        i_batch = int((cumulative_cost + cost / 2) * n_batches / total_cost)
+        n_batch_pages[i_batch] += 1
+        cumulative_cost += cost
+    ranges = []
+    start_idx = 0
+    for n in n_batch_pages:
+        if n > 0:
+            ranges.append((start_idx, n))
+        start_idx += n
+    return ranges
+
+
+def _error_row() -> dict:
+    """Row written in the output in place of data that could not be deserialized,
+    its keys are the columns of the output
+
+    Returns
+    -------
+    dict
+        row with an error message as company
+    """
+    error_msg = _("ERROR, SOMETHING WENT WRONG!!!!")
+    return Equity(
+        page=9999,
+        targets=[error_msg],
+        company=error_msg,
+        subfund=None,
+        nominal_quantity=None,
+        market_value=None,
+        perc_net_assets=0.0,
+        currency=Currency.EUR,
+    ).to_dict()
+
+
 def pipeline_batch(
-    batch_pages: List[str],
+    pdf_source: str | bytes,
     i_page_batch: int,
+    n_batch_pages: int,
     n_pages: int,
     targets: List[str],
     module_name: str,
+    xml_cache: Optional[Path] = None,
 ) -> pd.DataFrame:
-    """Apply the pipeline of actions in order to get data in `csv`
+    """Apply the pipeline of actions in order to get data in `csv`,
+    starting from the decoding of the pages of the batch
 
     Parameters
     ----------
-    pdf_file : pypdf.Document
-        `pdf` document to process in the format used in the python package `pymupdf`
+    pdf_source : str | bytes
+        file name or content of the `pdf` document to process
+    i_page_batch : int
+        number of the first page of the batch (starting from 1)
+    n_batch_pages : int
+        number of pages in the batch
+    n_pages : int
+        total number of pages in the document
     targets : List[str]
         the list of relevant companies in the report from which data is relevant
-    funcs : dict
-        the dictionary containing the functions to use in order to parse the pdf
+    module_name : str
+        name of the format module whose functions are used to parse the pdf
+    xml_cache : Optional[Path]
+        cache directory of the document for the pages decoded to xml,
+        if `None` the pages are always decoded
 
     Returns
     -------
     pd.DataFrame
         pandas dataframe with extracted data
     """
-    end_page_batch = i_page_batch + len(batch_pages)
+    end_page_batch = i_page_batch + n_batch_pages
     logger.info(
         _("Starting batch form page %i to %i"),
         i_page_batch,
         end_page_batch,
     )
-    parser = etree.XMLParser(recover=True)
-    xml_roots = [etree.fromstring(page, parser=parser) for page in batch_pages]
     module = _get_module(module_name)
     logger.info(
         _("Extracting relevant blocks of pdf from page %i to %i..."),
         i_page_batch,
         end_page_batch,
     )
-    pdf_blocks = pdf_filter_exec(xml_roots, i_page_batch, n_pages, module.pdf_filter)
+    with _open_document(pdf_source) as pdf_file:
+        # pages are decoded and parsed one at a time while filtering, and the
+        # blocks of a page release its tree once their content is read
+        xml_roots = (
+            etree.fromstring(_page_xml(pdf_file, i, xml_cache), parser=xml_parser)
+            for i in range(i_page_batch - 1, i_page_batch - 1 + n_batch_pages)
+        )
+        pdf_blocks = pdf_filter_exec(
+            xml_roots, i_page_batch, n_pages, module.pdf_filter
+        )
     logger.info(
         _("Filtering relevant blocks of text from page %i to %i..."),
         i_page_batch,
@@ -106,23 +315,10 @@ def pipeline_batch(
     )
     filtered_text = text_extract_exec(pdf_blocks, targets, module.text_extract)
     financtial_data = deserialize_exec(filtered_text, targets, module.deserialize)
-    error_msg = _("ERROR, SOMETHING WENT WRONG!!!!")
+    error_row = _error_row()
+    # deserialization is lazy: each row is converted as soon as it is produced
     df = pd.DataFrame(
-        [
-            fd.to_dict()
-            if fd is not None
-            else Equity(
-                page=9999,
-                targets=[error_msg],
-                company=error_msg,
-                subfund=None,
-                nominal_quantity=None,
-                market_value=None,
-                perc_net_assets=0.0,
-                currency=Currency.EUR,
-            ).to_dict()
-            for fd in financtial_data
-        ]
+        [fd.to_dict() if fd is not None else error_row for fd in financtial_data]
     )
     return df
 
@@ -273,24 +469,39 @@ def _main_job(config, n_workers):
     pdf_file, format_pdf = _get_document(config)
     format_pdf = _update_format(config, format_pdf)
     prefix_out = config["PREFIX_OUT"]
-    logger.debug(_("Starting decoding pdf to xml..."))
-    pdf_file_xml = [page.get_text("xml").encode() for page in pdf_file]
-    logger.debug(_("End decoding pdf to xml!"))
+    # pages are decoded to xml by the workers, each one on its own batch
+    pdf_source = _document_source(pdf_file)
+    n_pages = pdf_file.page_count
+    batch_ranges = _batch_ranges(pdf_file, n_workers)
+    pdf_file.close()
+    xml_cache = None
+    if config["XML_CACHE"] is not None:
+        xml_cache = config["XML_CACHE"] / _document_key(pdf_source)
+        xml_cache.mkdir(parents=True, exist_ok=True)
     targets = get_targets()
     logger.debug(_("First 5 targets: %s"), str(targets[: min(5, len(targets))]))
-    n_pages = len(pdf_file_xml)
-    batch_size = (n_pages + n_workers - 1) // n_workers
     batches = []
-    for i in range(n_workers):
-        start_idx = i * batch_size
-        end_idx = min((i + 1) * batch_size, n_pages)
-        batch_pages = pdf_file_xml[start_idx:end_idx]
-        batches.append((batch_pages, start_idx + 1, n_pages, targets, format_pdf.name))
+    for start_idx, n_batch_pages in batch_ranges:
+        batches.append(
+            (
+                pdf_source,
+                start_idx + 1,
+                n_batch_pages,
+                n_pages,
+                targets,
+                format_pdf.name,
+                xml_cache,
+            )
+        )
 
     results_batches = None
-    if n_workers > 1:
+    if not batches:
+        logger.warning(_("The document has no pages"))
+        # same columns of a document with pages, so the output keeps its header
+        return pd.DataFrame(columns=list(_error_row())), format_pdf, prefix_out
+    if len(batches) > 1:
         stderr_log.setFormatter(STANDARD_LOG_FORMATTER_MP)
-        with Pool(processes=n_workers) as pool:
+        with Pool(processes=len(batches)) as pool:
             results_batches = pool.starmap(pipeline_batch, batches)
         stderr_log.setFormatter(STANDARD_LOG_FORMATTER)
     else:
@@ -1,7 +1,6 @@
 from pathlib import Path
 import shutil
-from lxml import etree
-from freeports_analysis.main import get_targets
+from freeports_analysis.main import get_targets, xml_parser
 
 out_dir = Path(__file__).parent / "output/"
 data_dir = Path(__file__).parent / "data/"
@@ -37,7 +36,6 @@ single_page_tests = {
     "ASTERIA_2023": [21, 26],
 }
 
-xml_parser = etree.XMLParser(recover=True)
 targets = get_targets()
 
 conf = {
@@ -52,4 +50,5 @@ conf = {
     "CONFIG_FILE": None,
     "PREFIX_OUT": None,
     "SEPARATE_OUT_FILES": None,
+    "XML_CACHE": None,
 }
@@ -0,0 +1,81 @@
+import pytest
+from freeports_analysis.formats_utils import (
+    default_if_not_implemented,
+    overwrite_if_implemented,
+)
+
+
+def _default(x):
+    return ("default", x)
+
+
+def _stub_pass(x):
+    pass
+
+
+def _stub_ellipsis(x): ...
+
+
+def _stub_doc(x):
+    """Not implemented"""
+
+
+def _stub_raise(x):
+    raise NotImplementedError
+
+
+def _stub_doc_raise(x):
+    """Not implemented"""
+    raise NotImplementedError
+
+
+def _stub_return_none(x):
+    return None
+
+
+def _implemented(x):
+    return ("implemented", x)
+
+
+def _partially_implemented(x):
+    if x > 0:
+        return ("implemented", x)
+    raise NotImplementedError
+
+
+stubs = [
+    _stub_pass,
+    _stub_ellipsis,
+    _stub_doc,
+    _stub_raise,
+    _stub_doc_raise,
+    _stub_return_none,
+]
+
+
+@pytest.mark.parametrize("stub", stubs)
+def test_default_if_not_implemented_stub(stub):
+    func = default_if_not_implemented(_default)(stub)
+    assert func(1) == ("default", 1)
+
+
+@pytest.mark.parametrize("stub", stubs)
+def test_overwrite_if_implemented_stub(stub):
+    func = overwrite_if_implemented(stub)(_default)
+    assert func(1) == ("default", 1)
+
+
+def test_default_if_not_implemented_implemented():
+    func = default_if_not_implemented(_default)(_implemented)
+    assert func(1) == ("implemented", 1)
+    func = default_if_not_implemented(_default)(_partially_implemented)
+    assert func(1) == ("implemented", 1)
+    assert func(-1) == ("default", -1)
+
+
+def test_overwrite_if_implemented_implemented():
+    func = overwrite_if_implemented(_implemented)(_default)
+    assert func(1) == ("implemented", 1)
+    func = overwrite_if_implemented(_partially_implemented)(_default)
+    assert func(1) == ("implemented", 1)
+    assert func(-1) == ("default", -1)
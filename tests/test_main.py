@@ -0,0 +1,174 @@
+from .conftest import data_dir, out_dir, conf
+import gzip
+from pathlib import Path
+import pytest
+import pandas as pd
+from pymupdf import Document
+import freeports_analysis as fra
+from freeports_analysis import main as fra_main
+
+fmt = "ASTERIA_2023"
+report = data_dir / fmt / "report.pdf"
+
+
+def _pdf_without_pages() -> bytes:
+    # pymupdf refuses to save a document without pages, so it is written by hand
+    objs = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [] /Count 0 >>",
+    ]
+    pdf = b"%PDF-1.4\n"
+    offsets = []
+    for i, obj in enumerate(objs, 1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n" % i + obj + b"\nendobj\n"
+    xref = len(pdf)
+    pdf += b"xref\n0 3\n0000000000 65535 f \n"
+    pdf += b"".join(b"%010d 00000 n \n" % off for off in offsets)
+    pdf += b"trailer\n<< /Size 3 /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % xref
+    return pdf
+
+
+def _pdf_one_page() -> bytes:
+    with Document() as pdf:
+        pdf.new_page().insert_text((72, 72), "one page")
+        return pdf.tobytes()
+
+
+def _job_conf(pdf: Path, xml_cache=None) -> dict:
+    return conf | {
+        "PDF": pdf,
+        "FORMAT": fra.consts.PdfFormats.__members__[fmt],
+        "XML_CACHE": xml_cache,
+        "OUT_CSV": out_dir / f"out-{fmt}.csv",
+    }
+
+
+def test_xml_cache_first_run_writes_entries(tmp_path):
+    with Document(report) as pdf:
+        xml = fra_main._page_xml(pdf, 3, tmp_path)
+        assert xml == pdf[3].get_text("xml").encode()
+    assert gzip.decompress((tmp_path / "3.xml.gz").read_bytes()) == xml
+
+
+def test_xml_cache_second_run_reads_entries(tmp_path, monkeypatch):
+    df_no_cache, _, _ = fra_main._main_job(_job_conf(report), 1)
+    df_first, _, _ = fra_main._main_job(_job_conf(report, tmp_path), 1)
+    (doc_cache,) = tmp_path.iterdir()
+    assert len(list(doc_cache.glob("*.xml.gz"))) == Document(report).page_count
+
+    def no_decoding(*args, **kwargs):
+        raise AssertionError("page decoded while its xml is cached")
+
+    monkeypatch.setattr(fra_main.pypdf.Page, "get_text", no_decoding)
+    df_second, _, _ = fra_main._main_job(_job_conf(report, tmp_path), 1)
+    pd.testing.assert_frame_equal(df_first, df_no_cache)
+    pd.testing.assert_frame_equal(df_second, df_first)
+
+
+def test_xml_cache_no_partial_entries(tmp_path, monkeypatch):
+    with Document(report) as pdf:
+        fra_main._page_xml(pdf, 0, tmp_path)
+        assert [p.name for p in tmp_path.iterdir()] == ["0.xml.gz"]
+
+        def interrupted_write(self, data):
+            with open(self, "wb") as f:
+                f.write(data[: len(data) // 2])
+            raise KeyboardInterrupt
+
+        with monkeypatch.context() as m:
+            m.setattr(Path, "write_bytes", interrupted_write)
+            with pytest.raises(KeyboardInterrupt):
+                fra_main._page_xml(pdf, 1, tmp_path)
+        assert [p.name for p in tmp_path.iterdir()] == ["0.xml.gz"]
+        xml = fra_main._page_xml(pdf, 1, tmp_path)
+        assert xml == pdf[1].get_text("xml").encode()
+        assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_xml_cache_concurrent_writers(tmp_path, monkeypatch):
+    write_bytes = Path.write_bytes
+    with Document(report) as pdf:
+        xml = pdf[1].get_text("xml").encode()
+
+        def write_with_other_writer(self, data):
+            # another writer of the same page completes while this one writes
+            monkeypatch.setattr(Path, "write_bytes", write_bytes)
+            with open(self, "wb") as f:
+                f.write(data[: len(data) // 2])
+                assert fra_main._page_xml(pdf, 1, tmp_path) == xml
+                f.write(data[len(data) // 2 :])
+
+        monkeypatch.setattr(Path, "write_bytes", write_with_other_writer)
+        assert fra_main._page_xml(pdf, 1, tmp_path) == xml
+    assert [p.name for p in tmp_path.iterdir()] == ["1.xml.gz"]
+    assert gzip.decompress((tmp_path / "1.xml.gz").read_bytes()) == xml
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        lambda entry: entry[: len(entry) // 2],
+        lambda entry: entry[:10] + bytes(len(entry) - 10),
+        lambda entry: b"not gzip",
+        lambda entry: b"",
+    ],
+)
+def test_xml_cache_corrupt_entry(tmp_path, corrupt):
+    with Document(report) as pdf:
+        xml = fra_main._page_xml(pdf, 2, tmp_path)
+        entry = tmp_path / "2.xml.gz"
+        entry.write_bytes(corrupt(entry.read_bytes()))
+        assert fra_main._page_xml(pdf, 2, tmp_path) == xml
+    assert gzip.decompress(entry.read_bytes()) == xml
+
+
+def test_xml_cache_key_follows_content(tmp_path):
+    content = report.read_bytes()
+    copy = tmp_path / "copy.pdf"
+    copy.write_bytes(content)
+    key = fra_main._document_key(content)
+    assert fra_main._document_key(str(report)) == key
+    assert fra_main._document_key(str(copy)) == key
+    assert fra_main._document_key(content + b"\n%changed\n") != key
+
+
+def _check_batch_ranges(ranges, n_pages, n_batches):
+    assert len(ranges) <= min(n_batches, n_pages)
+    expected_start = 0
+    for start, n in ranges:
+        assert start == expected_start
+        assert n > 0
+        expected_start += n
+    assert expected_start == n_pages
+
+
+@pytest.mark.parametrize("n_batches", [1, 2, 3, 8, 41, 100])
+def test_batch_ranges(n_batches):
+    with Document(report) as pdf:
+        ranges = fra_main._batch_ranges(pdf, n_batches)
+        _check_batch_ranges(ranges, pdf.page_count, n_batches)
+    if n_batches == 1:
+        assert ranges == [(0, 41)]
+
+
+@pytest.mark.parametrize("n_batches", [1, 4])
+def test_batch_ranges_one_page(n_batches):
+    with Document(stream=_pdf_one_page()) as pdf:
+        assert fra_main._batch_ranges(pdf, n_batches) == [(0, 1)]
+
+
+@pytest.mark.parametrize("n_batches", [1, 4])
+def test_batch_ranges_no_pages(n_batches):
+    with Document(stream=_pdf_without_pages()) as pdf:
+        assert pdf.page_count == 0
+        assert fra_main._batch_ranges(pdf, n_batches) == []
+
+
+def test_main_job_no_pages_columns(tmp_path):
+    empty_pdf = tmp_path / "empty.pdf"
+    empty_pdf.write_bytes(_pdf_without_pages())
+    df_empty, _, _ = fra_main._main_job(_job_conf(empty_pdf), 1)
+    df, _, _ = fra_main._main_job(_job_conf(report), 1)
+    assert df_empty.empty
+    assert list(df_empty.columns) == list(df.columns)
@@ -0,0 +1,78 @@
+import dill
+import pytest
+from .conftest import data_dir, targets
+from freeports_analysis.formats_utils import normalize_string
+from freeports_analysis.formats_utils.text_extract.match import (
+    target_fuzzy_match,
+    target_prefix_match,
+)
+
+# (content, target) pairs matched in the fixture blocks, with the thresholds
+# the formats pass to `target_fuzzy_match` and `target_prefix_match`
+fixture_matches = {
+    ("ARCA", 20, 0.8): {
+        ("MOTOROLA SOLUTIONS INC \n", "Motorola Solutions"),
+    },
+    ("MEDIOLANUM", 55, 0.65): {
+        ("COCA COLA CO/THE \n", "Coca-Cola Co"),
+        ("SIEMENS AG REG \n", "Siemens"),
+    },
+}
+
+
+def _match(content, target, ratio):
+    return target_fuzzy_match(content, target, ratio) and target_prefix_match(
+        content, target, 0.3
+    )
+
+
+@pytest.mark.parametrize("fixture", fixture_matches)
+def test_fixture_matches(fixture):
+    fmt, page, ratio = fixture
+    with (data_dir / fmt / f"pdf_blks-{page}.pkl").open("rb") as f:
+        contents = {blk.content for blk in dill.load(f)}
+    matches = {
+        (content, target)
+        for content in contents
+        for target in targets
+        if target.strip() and _match(content, target, ratio)
+    }
+    assert matches == fixture_matches[fixture]
+
+
+@pytest.mark.parametrize(
+    "content,target,ratio,expected",
+    [
+        # indel similarity 0.9
+        ("MOTOROLA SOLUTIONS INC \n", "Motorola Solutions", 0.8, True),
+        ("MOTOROLA SOLUTIONS INC \n", "Motorola Solutions", 0.9, True),
+        ("MOTOROLA SOLUTIONS INC \n", "Motorola Solutions", 0.91, False),
+        # indel similarity 0.786, prefix similarity 0.33
+        ("COCA COLA CO/THE \n", "Coca-Cola Co", 0.65, True),
+        ("COCA COLA CO/THE \n", "Coca-Cola Co", 0.8, False),
+        # indel similarity 0.667, just above the MEDIOLANUM threshold
+        ("SIEMENS AG REG \n", "Siemens", 0.65, True),
+        ("SIEMENS AG REG \n", "Siemens", 0.8, False),
+        # indel similarity 0.667 but no common prefix
+        ("ASML HOLDING \n", "RE/MAX Holdings", 0.65, False),
+    ],
+)
+def test_match_thresholds(content, target, ratio, expected):
+    assert _match(content, target, ratio) == expected
+
+
+@pytest.mark.parametrize("fixture", fixture_matches)
+def test_fixture_matches_normalized(fixture):
+    fmt, page, ratio = fixture
+    with (data_dir / fmt / f"pdf_blks-{page}.pkl").open("rb") as f:
+        contents = {blk.content for blk in dill.load(f)}
+    for content in contents:
+        norm_content = normalize_string(content)
+        for target in targets:
+            norm_target = normalize_string(target)
+            assert target_fuzzy_match(
+                norm_content, norm_target, ratio, normalized=True
+            ) == target_fuzzy_match(content, target, ratio)
+            assert target_prefix_match(
+                norm_content, norm_target, 0.3, normalized=True
+            ) == target_prefix_match(content, target, 0.3)
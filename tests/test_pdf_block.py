@@ -0,0 +1,57 @@
+import pickle
+import pytest
+from lxml import etree
+from freeports_analysis.formats import PdfBlock, pdf_filter_exec
+from freeports_analysis.formats_utils.pdf_filter import OnePdfBlockType
+
+page = etree.fromstring(
+    "<block>"
+    '<line text="ab"><font><char c="a"/><char c="b"/></font></line>'
+    '<line text="c"><font><char c="c"/></font></line>'
+    "</block>"
+)
+block_type = OnePdfBlockType.RELEVANT_BLOCK
+
+
+def test_from_element():
+    blk = PdfBlock(block_type, {}, page[0])
+    assert blk.content == "ab\n"
+    assert PdfBlock(block_type, {}, page).content == "ab\nc\n"
+
+
+def test_from_elements():
+    blk = PdfBlock.from_elements(block_type, {"page": 1}, list(page))
+    assert blk.content == "ab\nc\n"
+    assert blk == PdfBlock(block_type, {"page": 1}, page)
+    assert pickle.loads(pickle.dumps(blk)) == blk
+
+
+@pytest.mark.parametrize("xml_ele", [list(page), None, "<line/>"])
+def test_not_an_element(xml_ele):
+    with pytest.raises(TypeError):
+        PdfBlock(block_type, {}, xml_ele)
+
+
+def test_from_elements_not_elements():
+    with pytest.raises(TypeError):
+        PdfBlock.from_elements(block_type, {}, [page[0], "<line/>"])
+    with pytest.raises(ValueError):
+        PdfBlock.from_elements(block_type, {}, [])
+
+
+def test_element_released_once_content_known():
+    blk = PdfBlock(block_type, {}, page[0])
+    assert blk._xml_ele is page[0]
+    assert blk.content == "ab\n"
+    assert blk._xml_ele is None
+    assert PdfBlock(block_type, {}, page[0], "ab\n")._xml_ele is None
+    assert PdfBlock.from_elements(block_type, {}, list(page))._xml_ele is None
+
+
+def test_pdf_filter_exec_releases_pages():
+    blks = pdf_filter_exec(
+        [page, page], 0, 2, lambda root: [PdfBlock(block_type, {}, root[1])]
+    )
+    assert [blk.metadata["page"] for blk in blks] == [1, 2]
+    assert all(blk._xml_ele is None for blk in blks)
+    assert [blk.content for blk in blks] == ["c\n", "c\n"]
@@ -0,0 +1,90 @@
+import pytest
+from pymupdf import Document
+from lxml import etree
+from freeports_analysis.formats_utils.pdf_filter import (
+    filter_page_if,
+    standard_pdf_filtering,
+    _extracted_lines,
+    _page_lines,
+)
+from freeports_analysis.formats_utils.pdf_filter.pdf_parts.position import YRange
+from freeports_analysis.formats_utils.pdf_filter.xml.position import is_contained
+from .conftest import data_dir, xml_parser
+
+page = etree.fromstring(
+    "<page>"
+    '<line bbox="1 2 3 4" text="a"><font name="A" size="5"/></line>'
+    '<line bbox="1 5 3 7" text="b"><font name="B" size="5"/></line>'
+    "</page>"
+)
+
+
+def test_extracted_lines_cached_per_page():
+    calls = []
+
+    @filter_page_if(lambda _: True)
+    def pdf_filter(xml_root):
+        calls.append(_extracted_lines(xml_root, "A"))
+        calls.append(_extracted_lines(xml_root, "A"))
+        calls.append(_extracted_lines(xml_root, "B"))
+        return []
+
+    pdf_filter(page)
+    assert calls[0] is calls[1]
+    assert [line.txt for line in calls[0]] == ["a"]
+    assert [line.txt for line in calls[2]] == ["b"]
+    assert _page_lines.get() is None
+
+
+def test_extracted_lines_not_cached_outside_filter():
+    first = _extracted_lines(page, "A")
+    assert first is not _extracted_lines(page, "A")
+    assert [line.txt for line in first] == ["a"]
+    assert _page_lines.get() is None
+
+
+def test_content_from_chars():
+    # on this page pymupdf writes U+FFFD in the text attribute of the line,
+    # while its chars keep the `\x02` around the name
+    with Document(data_dir / "EURIZON" / "report.pdf") as pdf:
+        xml_root = etree.fromstring(pdf[1].get_text("xml").encode(), xml_parser)
+
+    @standard_pdf_filtering(
+        header_txt="Limited Tracking Error",
+        header_font="Frutiger-Black",
+        subfund_height=YRange(None, None),
+        subfund_font="Frutiger-Black",
+        body_font="Frutiger-Black",
+    )
+    def pdf_filter(xml_root):
+        pass
+
+    contents = [blk.content for blk in pdf_filter(xml_root)]
+    txts = [line.txt + "\n" for line in _extracted_lines(xml_root, "Frutiger-Black")]
+    assert "Line \x02Limited Tracking Error\x02\n" in contents
+    assert "Line �Limited Tracking Error�\n" in txts
+    assert "Line �Limited Tracking Error�\n" not in contents
+
+
+@pytest.mark.parametrize(
+    "x_range,y_range,expected",
+    [
+        (None, None, True),
+        ((None, None), (None, None), True),
+        ((0, 10), None, True),
+        ((2, None), None, False),
+        (None, (None, 3), False),
+        (None, (2, 4), True),
+    ],
+)
+def test_is_contained(x_range, y_range, expected):
+    line = etree.fromstring('<line bbox="1 2 3 4"/>')
+    assert is_contained(line, x_range, y_range) == expected
+
+
+def test_is_contained_no_bbox():
+    line = etree.fromstring("<line/>")
+    assert is_contained(line)
+    assert is_contained(line, (None, None), (None, None))
+    with pytest.raises(TypeError):
+        is_contained(line, (0, 10))
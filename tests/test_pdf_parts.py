@@ -0,0 +1,27 @@
+import pytest
+from lxml import etree
+from freeports_analysis.formats_utils.pdf_filter.pdf_parts import ExtractedPdfLine
+
+
+def _line(fonts: str) -> etree.Element:
+    return etree.fromstring(f'<line bbox="1 2 3 4" text="abc">{fonts}</line>')
+
+
+@pytest.mark.parametrize(
+    "fonts, name, size",
+    [
+        ('<font name="A" size="5"/><font name="B" size="6"/>', "A", 5.0),
+        ('<font size="3"/><font name="B" size="6"/>', "B", 3.0),
+        ('<font name="A"/><font size="4"/>', "A", 4.0),
+    ],
+)
+def test_extracted_line_font(fonts, name, size):
+    line = ExtractedPdfLine(_line(fonts))
+    assert line.font == name
+    assert line.text_size == size
+
+
+@pytest.mark.parametrize("fonts", ["", '<font size="3"/>', '<font name="A"/>'])
+def test_extracted_line_no_font(fonts):
+    with pytest.raises(IndexError):
+        ExtractedPdfLine(_line(fonts))
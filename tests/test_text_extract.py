@@ -0,0 +1,68 @@
+import re
+import pytest
+from freeports_analysis.formats_utils.text_extract import (
+    _date_layouts,
+    _last_date,
+    _last_percentage,
+)
+
+# regexes replaced by the scans, the scans must give the same group
+date_regexes = {
+    (2, 2, 4): re.compile(r".*(\d{2}[/-]\d{2}[/-]\d{4}).*", re.DOTALL),
+    (4, 2, 2): re.compile(r".*(\d{4}[/-]\d{2}[/-]\d{2}).*", re.DOTALL),
+    (2, 2, 2): re.compile(r".*(\d{2}[/-]\d{2}[/-]\d{2}).*", re.DOTALL),
+}
+perc_regex = re.compile(r".*((\d+[\.,]\d+)\s*%).*", re.DOTALL)
+
+contents = [
+    "",
+    "ENI SPA",
+    "BTP 01/12/2030",
+    "BTP 01-12-2030",
+    "BTP 01/12-2030 EUR",
+    "BTP 01-12/2030 EUR",
+    "01/12/2030 BTP",
+    "BTP\n2030-12-01",
+    "2030/12-01",
+    "BTP 01/12/30",
+    "01/12/30",
+    "BTP 01/01/2025 31/12/2030",
+    "01/01/25 31-12-2030 15/06/27",
+    "1/12/2030 1-2-30",
+    "123/45/67890",
+    "01//12/2030 01/12//2030",
+    "BTP 01/1a/2030 -/-/-",
+    "BTP ٠١/١٢/٢٠٣٠",
+    "BTP 4.5% 15/06/2027",
+    "BTP 12,5 %",
+    "BTP 12,5 \n\t%",
+    "BTP 12.50% 2030",
+    "BTP 1.25% 2,5%",
+    "BTP 2,5% 100%",
+    "BTP 100%",
+    "BTP %",
+    "% 1,5",
+    "BTP .5%",
+    "BTP 5.%",
+    "BTP 1.2.3%",
+    "1,5%",
+    "BTP 1,5 %",
+    "BTP ١.٥%",
+]
+
+
+@pytest.mark.parametrize("layout", _date_layouts)
+@pytest.mark.parametrize("content", contents)
+def test_last_date(content, layout):
+    match = date_regexes[layout].match(content)
+    assert _last_date(content, layout) == (match[1] if match else None)
+
+
+@pytest.mark.parametrize("content", contents)
+def test_last_percentage(content):
+    match = perc_regex.match(content)
+    assert _last_percentage(content) == (match[1] if match else None)
+
+
+def test_layouts_match_regexes():
+    assert set(_date_layouts) == set(date_regexes)